@@ -1,15 +1,12 @@
-from field_framework import FieldRegistry
-from python_magnetunits.field_definitions import (
-    create_electromagnetic_fields,
-    create_thermal_fields,
-    create_material_property_fields
-)
+from python_magnetunits import FieldRegistry
+from python_magnetunits.physics import electromagnetic, hydraulics, mechanical, thermal
 
 # Create registry with all fields
 registry = FieldRegistry()
-registry.bulk_register(create_electromagnetic_fields())
-registry.bulk_register(create_thermal_fields())
-registry.bulk_register(create_material_property_fields())
+electromagnetic.register_electromagnetic_fields(registry)
+thermal.register_thermal_fields(registry)
+hydraulics.register_hydraulic_fields(registry)
+mechanical.register_mechanical_fields(registry)
 
 # Look up material property fields
 rho_field = registry.get("ρ")  # or "Density" or "rho"
@@ -21,11 +18,13 @@ label = rho_field.format_label(target_unit="g/cm^3", use_latex=True)
 # Output: "$\rho$ [g/cm³]"
 
 # Convert values (when you have them from elsewhere)
-rho_copper = 8.96  # g/cm³
-rho_si = rho_field.convert(rho_copper, "kg/m^3")
-# Output: 8960.0
+rho_si = 8960.0  # kg/m³
+rho_copper = rho_field.convert(rho_si, "g/cm^3")
+# Output: ~8.96
 
 # List all material property fields
-mat_fields = registry.list_fields(category="material_property")
+mat_fields = registry.list_fields(
+    predicate=lambda field: field.metadata.get("type") == "material_property"
+)
 for field in mat_fields:
     print(f"  - {field.name} ({field.symbol}): {field.unit}")
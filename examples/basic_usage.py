@@ -115,7 +115,7 @@ def example_array_operations():
 
     B = Field(name="B", symbol="B", unit="tesla")
 
-    # Convert array of values
+    # Convert array of values (vectorized, returns a NumPy array)
     values_tesla = [0.5, 1.0, 1.5, 2.0]
     values_millitesla = B.convert_array(values_tesla, "millitesla")
 
@@ -3,15 +3,46 @@ Example implementation of the new Field class for field-framework package.
 This shows how the refactored code would look.
 """
 
-from pint import UnitRegistry
-from typing import Optional, List, Any, Union
+import functools
+import sys
+from typing import Optional, List, Any, FrozenSet, Union
 from dataclasses import dataclass, field as dc_field
 
-# Initialize unit registry
-ureg = UnitRegistry()
+# Unit registry, built on first use: constructing a pint UnitRegistry parses
+# its whole definitions file, which is wasted work for imports that never
+# convert anything.
+_ureg = None
 
 
-@dataclass
+def _get_ureg():
+    """Return the module unit registry, creating it on first call."""
+    global _ureg
+    if _ureg is None:
+        # Share pint's application registry so Units built here interoperate
+        # with (and unpickle into) the registry used by the rest of the code
+        from pint import get_application_registry
+        _ureg = get_application_registry()
+    return _ureg
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_unit(unit_str: str) -> Any:
+    """Parse a unit string into a pint Unit, memoized (pint parsing is slow)."""
+    return _get_ureg().Unit(unit_str)
+
+
+def __getattr__(name):
+    """Expose ``ureg`` lazily as a module attribute (PEP 562)."""
+    if name == "ureg":
+        return _get_ureg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# __slots__ on dataclasses needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Field:
     """
     Represents a physical field with units, symbols, and metadata.
@@ -44,16 +75,28 @@ class Field:
     exclude_regions: List[str] = dc_field(default_factory=list)
     default_value: Optional[Any] = None
     metadata: dict = dc_field(default_factory=dict)
+
+    # Set view of exclude_regions for O(1) region checks
+    _exclude_set: FrozenSet[str] = dc_field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Initialize and validate the field after creation."""
-        # Convert string units to pint Units
-        if isinstance(self.unit, str):
-            self.unit = ureg(self.unit)
+        # String units are kept as-is and resolved on first use (see pint_unit)
         
         # Use symbol as latex_symbol if not provided
         if self.latex_symbol is None:
             self.latex_symbol = self.symbol
+
+        self._exclude_set = frozenset(self.exclude_regions)
+    
+    @property
+    def pint_unit(self) -> Any:
+        """The field's unit as a pint Unit, parsing a unit string on first access."""
+        if isinstance(self.unit, str):
+            self.unit = _parse_unit(self.unit)
+        return self.unit
     
     def convert(self, value: float, to_unit: Union[str, Any]) -> float:
         """
@@ -72,9 +115,9 @@ class Field:
             15000.0
         """
         if isinstance(to_unit, str):
-            to_unit = ureg(to_unit)
+            to_unit = _parse_unit(to_unit)
         
-        quantity = ureg.Quantity(value, self.unit)
+        quantity = _get_ureg().Quantity(value, self.pint_unit)
         return quantity.to(to_unit).magnitude
     
     def convert_array(self, values: List[float], 
@@ -82,6 +125,9 @@ class Field:
         """
         Convert an array of values to a target unit.
         
+        The whole list is converted as one NumPy-backed Quantity, so the unit
+        conversion is resolved once instead of once per element.
+        
         Args:
             values: List of values to convert
             to_unit: Target unit
@@ -89,7 +135,12 @@ class Field:
         Returns:
             List of converted values
         """
-        return [self.convert(v, to_unit) for v in values]
+        import numpy as np  # only needed for array conversion
+        
+        if isinstance(to_unit, str):
+            to_unit = _parse_unit(to_unit)
+        arr = np.asarray(values, dtype=float)
+        return _get_ureg().Quantity(arr, self.pint_unit).to(to_unit).magnitude.tolist()
     
     def validate_value(self, value: Any) -> bool:
         """
@@ -101,8 +152,11 @@ class Field:
         Returns:
             True if value can be represented in this field's unit
         """
+        # Plain numbers are always representable: skip building a Quantity
+        if isinstance(value, (int, float)):
+            return True
         try:
-            ureg.Quantity(value, self.unit)
+            _get_ureg().Quantity(value, self.pint_unit)
             return True
         except (ValueError, TypeError):
             return False
@@ -130,7 +184,7 @@ class Field:
         
         if target_unit:
             if isinstance(target_unit, str):
-                target_unit = ureg(target_unit)
+                target_unit = _parse_unit(target_unit)
             unit_str = f"{target_unit:~P}"  # Pint pretty print format
             return f"{sym} [{unit_str}]"
         
@@ -153,7 +207,7 @@ class Field:
             >>> field.applies_to_region("Air")
             False
         """
-        return region not in self.exclude_regions
+        return region not in self._exclude_set
     
     def to_dict(self, input_unit=None, output_unit=None) -> dict:
         """
@@ -175,24 +229,47 @@ class Field:
         Returns:
             Dictionary in magnetrun format
         """
-        result = {
-            "Symbol": self.symbol,
-            "Units": [
-                input_unit or self.unit,
-                output_unit or self.unit
-            ],
-            "Exclude": self.exclude_regions
-        }
+        return self.to_dict_into({}, input_unit, output_unit)
+    
+    def to_dict_into(self, out: dict, input_unit=None, output_unit=None) -> dict:
+        """
+        Write the magnetrun-compatible dictionary into an existing dict.
+        
+        Same content as to_dict(), but lets batch serializers reuse a single
+        dict across fields instead of allocating one per field. Optional keys
+        ("mSymbol", "Val") left over from a previous field are removed.
+        
+        Args:
+            out: Dictionary to fill (modified in place)
+            input_unit: Input unit for conversion (default: field's unit)
+            output_unit: Output unit for conversion (default: field's unit)
+        
+        Returns:
+            The ``out`` dictionary
+        
+        Example:
+            >>> out = {}
+            >>> for field in fields:
+            ...     json.dump(field.to_dict_into(out), stream)
+        """
+        unit = self.pint_unit
+        out["Symbol"] = self.symbol
+        out["Units"] = [input_unit or unit, output_unit or unit]
+        out["Exclude"] = self.exclude_regions
         
         # Add LaTeX symbol if different from regular symbol
         if self.latex_symbol != self.symbol:
-            result["mSymbol"] = self.latex_symbol
+            out["mSymbol"] = self.latex_symbol
+        else:
+            out.pop("mSymbol", None)
         
         # Add default value if present
         if self.default_value is not None:
-            result["Val"] = self.default_value
+            out["Val"] = self.default_value
+        else:
+            out.pop("Val", None)
         
-        return result
+        return out
     
     @classmethod
     def from_dict(cls, name: str, field_dict: dict) -> 'Field':
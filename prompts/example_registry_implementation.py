@@ -3,9 +3,15 @@ Example implementation of FieldRegistry for field-framework package.
 Demonstrates centralized field management and lookup.
 """
 
-from typing import Dict, List, Optional, Callable
+import functools
+import logging
+import sys
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
 from dataclasses import dataclass
-from example_field_implementation import Field, ureg
+from example_field_implementation import Field, _get_ureg
+
+_LOG = logging.getLogger(__name__)
 
 
 class FieldRegistry:
@@ -32,8 +38,19 @@ class FieldRegistry:
         
         # Secondary indices for fast lookup
         self._by_symbol: Dict[str, Field] = {}
-        self._by_alias: Dict[str, List[Field]] = {}
-        self._by_category: Dict[str, List[Field]] = {}
+        # Buckets map field name -> Field: O(1) unregister, registration order kept
+        self._by_alias: Dict[str, Dict[str, Field]] = {}
+        self._by_category: Dict[str, Dict[str, Field]] = {}
+        
+        # Resolved identifier -> Field (name, symbol or unambiguous alias),
+        # so get() is a single dict probe
+        self._index: Dict[str, Field] = {}
+        # Aliases shared by several fields -> names of those fields, resolved
+        # alongside _index so get() misses need no recomputation
+        self._ambiguous: Dict[str, List[str]] = {}
+        
+        # Cached summary() text, reset whenever the registry changes
+        self._summary: Optional[str] = None
     
     def register(self, field: Field) -> None:
         """
@@ -53,28 +70,63 @@ class FieldRegistry:
         # Check for duplicate names
         if field.name in self._fields:
             raise ValueError(f"Field '{field.name}' already registered")
-        
+        self._register_unchecked(field)
+    
+    def _register_unchecked(self, field: Field) -> None:
+        """Index a field whose name is known not to be registered yet."""
+        self._summary = None
         # Store in primary dict
         self._fields[field.name] = field
         
         # Index by symbol
         if field.symbol in self._by_symbol:
-            # Warning: symbol collision
-            print(f"Warning: Symbol '{field.symbol}' used by multiple fields")
+            # Symbol collision (lazy %-formatting: free when WARNING is disabled)
+            _LOG.warning("Symbol '%s' used by multiple fields", field.symbol)
         self._by_symbol[field.symbol] = field
         
         # Index by aliases
         for alias in field.aliases:
-            if alias not in self._by_alias:
-                self._by_alias[alias] = []
-            self._by_alias[alias].append(field)
+            self._by_alias.setdefault(alias, {})[field.name] = field
         
-        # Index by category (if present in metadata)
+        # Index by category (if present in metadata); interned so lookups
+        # with the same string hit the identity fast path
         category = field.metadata.get('category')
         if category:
-            if category not in self._by_category:
-                self._by_category[category] = []
-            self._by_category[category].append(field)
+            category = sys.intern(category)
+            self._by_category.setdefault(category, {})[field.name] = field
+        
+        self._reindex(self._keys(field))
+    
+    @staticmethod
+    def _keys(field: Field) -> List[str]:
+        """Every identifier (name, symbol, aliases) a field is indexed under."""
+        return [field.name, field.symbol, *field.aliases]
+    
+    def _resolve(self, identifier: str) -> Optional[Field]:
+        """Resolve an identifier by priority: name, symbol, unambiguous alias."""
+        if identifier in self._fields:
+            return self._fields[identifier]
+        if identifier in self._by_symbol:
+            return self._by_symbol[identifier]
+        matches = self._by_alias.get(identifier)
+        if matches and len(matches) == 1:
+            return next(iter(matches.values()))
+        return None
+    
+    def _reindex(self, identifiers) -> None:
+        """Refresh the resolved index entries for the given identifiers."""
+        for identifier in identifiers:
+            field = self._resolve(identifier)
+            if field is None:
+                self._index.pop(identifier, None)
+                matches = self._by_alias.get(identifier)
+                if matches:
+                    self._ambiguous[identifier] = list(matches)
+                else:
+                    self._ambiguous.pop(identifier, None)
+            else:
+                self._index[identifier] = field
+                self._ambiguous.pop(identifier, None)
     
     def get(self, identifier: str) -> Optional[Field]:
         """
@@ -96,26 +148,14 @@ class FieldRegistry:
             >>> registry.get("B")                  # By symbol
             >>> registry.get("magnetic_field")     # By alias
         """
-        # Try name lookup (highest priority)
-        if identifier in self._fields:
-            return self._fields[identifier]
-        
-        # Try symbol lookup
-        if identifier in self._by_symbol:
-            return self._by_symbol[identifier]
-        
-        # Try alias lookup
-        if identifier in self._by_alias:
-            matches = self._by_alias[identifier]
-            if len(matches) == 1:
-                return matches[0]
-            elif len(matches) > 1:
-                # Ambiguous alias
-                field_names = [f.name for f in matches]
-                print(f"Warning: Alias '{identifier}' matches multiple fields: "
-                      f"{field_names}")
-                return None
-        
+        field = self._index.get(identifier)
+        if field is not None:
+            return field
+        
+        # Not indexed: unknown, or an alias shared by several fields
+        names = self._ambiguous.get(identifier)
+        if names is not None:
+            _LOG.warning("Alias '%s' matches multiple fields: %s", identifier, names)
         return None
     
     def get_or_raise(self, identifier: str) -> Field:
@@ -131,10 +171,11 @@ class FieldRegistry:
         Raises:
             KeyError: If field not found
         """
-        field = self.get(identifier)
-        if field is None:
-            raise KeyError(f"Field '{identifier}' not found in registry")
-        return field
+        # Direct index probe: no ambiguous-alias warning on the miss path
+        try:
+            return self._index[identifier]
+        except KeyError:
+            raise KeyError(f"Field '{identifier}' not found in registry") from None
     
     def list_fields(self, 
                    category: Optional[str] = None,
@@ -159,20 +200,16 @@ class FieldRegistry:
             ...     predicate=lambda f: str(f.unit) == "tesla"
             ... )
         """
-        fields = list(self._fields.values())
-        
-        # Filter by category
+        # Pick the source first so a category filter never copies all fields
         if category:
-            if category in self._by_category:
-                fields = self._by_category[category]
-            else:
-                fields = []
+            source = self._by_category.get(category, {}).values()
+        else:
+            source = self._fields.values()
         
         # Apply custom predicate
         if predicate:
-            fields = [f for f in fields if predicate(f)]
-        
-        return fields
+            return [f for f in source if predicate(f)]
+        return list(source)
     
     def list_categories(self) -> List[str]:
         """
@@ -183,12 +220,12 @@ class FieldRegistry:
         """
         return list(self._by_category.keys())
     
-    def bulk_register(self, fields: List[Field]) -> None:
+    def bulk_register(self, fields: Iterable[Field]) -> None:
         """
         Register multiple fields at once.
         
         Args:
-            fields: List of fields to register
+            fields: Fields to register (list, tuple or any iterable)
         
         Example:
             >>> fields = [
@@ -198,11 +235,18 @@ class FieldRegistry:
             ... ]
             >>> registry.bulk_register(fields)
         """
+        # Duplicate check inline (no exception per skipped field); names
+        # repeated within the batch are caught since _fields grows as we go
+        skipped = []
         for field in fields:
-            try:
-                self.register(field)
-            except ValueError as e:
-                print(f"Skipping: {e}")
+            if field.name in self._fields:
+                skipped.append(field.name)
+            else:
+                self._register_unchecked(field)
+        
+        if skipped:
+            _LOG.warning("Skipped %d already registered field(s): %s",
+                         len(skipped), skipped)
     
     def unregister(self, name: str) -> bool:
         """
@@ -218,6 +262,7 @@ class FieldRegistry:
             return False
         
         field = self._fields[name]
+        self._summary = None
         
         # Remove from all indices
         del self._fields[name]
@@ -227,16 +272,17 @@ class FieldRegistry:
         
         for alias in field.aliases:
             if alias in self._by_alias:
-                self._by_alias[alias].remove(field)
+                self._by_alias[alias].pop(name, None)
                 if not self._by_alias[alias]:
                     del self._by_alias[alias]
         
         category = field.metadata.get('category')
         if category and category in self._by_category:
-            self._by_category[category].remove(field)
+            self._by_category[category].pop(name, None)
             if not self._by_category[category]:
                 del self._by_category[category]
         
+        self._reindex(self._keys(field))
         return True
     
     def clear(self) -> None:
@@ -245,6 +291,9 @@ class FieldRegistry:
         self._by_symbol.clear()
         self._by_alias.clear()
         self._by_category.clear()
+        self._index.clear()
+        self._ambiguous.clear()
+        self._summary = None
     
     def __len__(self) -> int:
         """Return number of registered fields."""
@@ -252,7 +301,7 @@ class FieldRegistry:
     
     def __contains__(self, identifier: str) -> bool:
         """Check if a field exists (by name, symbol, or alias)."""
-        return self.get(identifier) is not None
+        return identifier in self._index
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -265,6 +314,9 @@ class FieldRegistry:
         Returns:
             Multi-line string with registry statistics
         """
+        if self._summary is not None:
+            return self._summary
+        
         lines = [
             f"FieldRegistry Summary:",
             f"  Total fields: {len(self._fields)}",
@@ -276,21 +328,41 @@ class FieldRegistry:
             for cat, fields in sorted(self._by_category.items()):
                 lines.append(f"    {cat}: {len(fields)}")
         
-        return "\n".join(lines)
+        self._summary = "\n".join(lines)
+        return self._summary
 
 
 # Create global default registry (similar to pint's UnitRegistry)
 default_registry = FieldRegistry()
 
 
-def create_electromagnetic_fields() -> List[Field]:
+# Metadata and exclusion lists shared by the factory-built fields below.
+# Fields never mutate them; the read-only proxies make that explicit so one
+# instance can safely be passed to every field in a category.
+_EM_MAGNETISM_META = MappingProxyType({"category": "electromagnetic", "physics": "magnetism"})
+_EM_ELECTRICITY_META = MappingProxyType({"category": "electromagnetic", "physics": "electricity"})
+_EM_COMPONENT_META = {
+    axis: MappingProxyType({"category": "electromagnetic", "component": axis})
+    for axis in ("x", "y", "z")
+}
+_THERMAL_META = MappingProxyType({"category": "thermal"})
+_EXCLUDE_AIR = ("Air",)
+_EXCLUDE_AIR_ISOLANT = ("Air", "Isolant")
+
+
+@functools.lru_cache(maxsize=None)
+def create_electromagnetic_fields() -> Tuple[Field, ...]:
     """
     Create standard electromagnetic fields.
+
+    The fields are built on the first call; later calls return the same tuple.
     
     Returns:
-        List of electromagnetic Field objects
+        Tuple of electromagnetic Field objects
     """
-    return [
+    # Resolved here rather than imported, so the registry is only built on first use
+    ureg = _get_ureg()
+    return (
         Field(
             name="MagneticField",
             symbol="B",
@@ -298,7 +370,7 @@ def create_electromagnetic_fields() -> List[Field]:
             description="Magnetic flux density",
             latex_symbol=r"$B$",
             aliases=["magnetic_field", "B_field"],
-            metadata={"category": "electromagnetic", "physics": "magnetism"}
+            metadata=_EM_MAGNETISM_META
         ),
         Field(
             name="MagneticField_x",
@@ -307,7 +379,7 @@ def create_electromagnetic_fields() -> List[Field]:
             description="Magnetic field x-component",
             latex_symbol=r"$B_x$",
             aliases=["Bx", "B_x"],
-            metadata={"category": "electromagnetic", "component": "x"}
+            metadata=_EM_COMPONENT_META["x"]
         ),
         Field(
             name="MagneticField_y",
@@ -316,7 +388,7 @@ def create_electromagnetic_fields() -> List[Field]:
             description="Magnetic field y-component",
             latex_symbol=r"$B_y$",
             aliases=["By", "B_y"],
-            metadata={"category": "electromagnetic", "component": "y"}
+            metadata=_EM_COMPONENT_META["y"]
         ),
         Field(
             name="MagneticField_z",
@@ -325,7 +397,7 @@ def create_electromagnetic_fields() -> List[Field]:
             description="Magnetic field z-component",
             latex_symbol=r"$B_z$",
             aliases=["Bz", "B_z"],
-            metadata={"category": "electromagnetic", "component": "z"}
+            metadata=_EM_COMPONENT_META["z"]
         ),
         Field(
             name="ElectricField",
@@ -334,8 +406,8 @@ def create_electromagnetic_fields() -> List[Field]:
             description="Electric field intensity",
             latex_symbol=r"$E$",
             aliases=["electric_field", "E_field"],
-            exclude_regions=["Air", "Isolant"],
-            metadata={"category": "electromagnetic", "physics": "electricity"}
+            exclude_regions=_EXCLUDE_AIR_ISOLANT,
+            metadata=_EM_ELECTRICITY_META
         ),
         Field(
             name="CurrentDensity",
@@ -344,15 +416,17 @@ def create_electromagnetic_fields() -> List[Field]:
             description="Current density",
             latex_symbol=r"$J$",
             aliases=["current_density", "J_current"],
-            exclude_regions=["Air", "Isolant"],
-            metadata={"category": "electromagnetic", "physics": "electricity"}
+            exclude_regions=_EXCLUDE_AIR_ISOLANT,
+            metadata=_EM_ELECTRICITY_META
         ),
-    ]
+    )
 
 
-def create_thermal_fields() -> List[Field]:
-    """Create standard thermal fields."""
-    return [
+@functools.lru_cache(maxsize=None)
+def create_thermal_fields() -> Tuple[Field, ...]:
+    """Create standard thermal fields (built once, then shared as a tuple)."""
+    ureg = _get_ureg()
+    return (
         Field(
             name="Temperature",
             symbol="T",
@@ -360,8 +434,8 @@ def create_thermal_fields() -> List[Field]:
             description="Temperature",
             latex_symbol=r"$T$",
             aliases=["temperature", "temp"],
-            exclude_regions=["Air"],
-            metadata={"category": "thermal"}
+            exclude_regions=_EXCLUDE_AIR,
+            metadata=_THERMAL_META
         ),
         Field(
             name="ThermalConductivity",
@@ -370,10 +444,10 @@ def create_thermal_fields() -> List[Field]:
             description="Thermal conductivity",
             latex_symbol=r"$k$",
             aliases=["thermal_conductivity", "k_thermal"],
-            exclude_regions=["Air"],
-            metadata={"category": "thermal"}
+            exclude_regions=_EXCLUDE_AIR,
+            metadata=_THERMAL_META
         ),
-    ]
+    )
 
 
 # Example usage
@@ -42,6 +42,7 @@ License:
 
 from .converters import (
     are_compatible,
+    compile_field_units,
     convert_array,
     convert_data,
     convert_value,
@@ -65,6 +66,7 @@ __all__ = [
     "default_registry",
     # Conversion functions
     "convert_data",
+    "compile_field_units",
     "convert_value",
     "convert_array",
     "get_unit_string",
@@ -73,17 +75,23 @@ __all__ = [
     "physics",
 ]
 
-# Version is read from package metadata (defined in pyproject.toml)
-# This ensures a single source of truth for the version number
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:
-    # Fallback for Python < 3.8 (though we require 3.9+)
-    from importlib_metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("python-magnetunits")
-except PackageNotFoundError:
-    # Package not installed (e.g., running from source without install)
-    # This is expected during development before running `pip install -e .`
-    __version__ = "0.0.0+unknown"
+def __getattr__(name: str) -> str:
+    """
+    Resolve ``__version__`` lazily from the installed package metadata.
+
+    Reading distribution metadata scans sys.path, so it is deferred until the
+    version is first requested and then cached as a module global.
+    """
+    if name == "__version__":
+        global __version__
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            __version__ = version("python-magnetunits")
+        except PackageNotFoundError:
+            # Package not installed (e.g., running from source without install)
+            # This is expected during development before running `pip install -e .`
+            __version__ = "0.0.0+unknown"
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,78 @@
+"""
+Bulk conversion kernels for applying precomputed unit conversion factors.
+
+Once a (from_unit, to_unit) pair has been reduced to a scale factor (and an
+offset for affine temperature scales), converting an array is a single fused
+``values * scale + offset`` loop. When Numba is installed, large arrays are
+processed by parallel JIT-compiled kernels; otherwise NumPy is used.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import Any, Optional
+
+import numpy as np
+
+# Numba is optional and slow to import, so it is only looked up here; the
+# kernels module is imported the first time a large array is converted
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Arrays smaller than this are converted with NumPy even when Numba is available
+NJIT_THRESHOLD = 1024
+
+_njit_module: Optional[Any] = None
+
+
+def _njit_kernels(values: np.ndarray) -> Optional[Any]:
+    """Return the JIT kernels module if it should be used for this array, else None."""
+    global HAS_NUMBA, _njit_module
+    if not HAS_NUMBA or values.size < NJIT_THRESHOLD:
+        return None
+    if _njit_module is None:
+        try:
+            from . import _kernels_njit
+        except ImportError:  # installed but not importable
+            HAS_NUMBA = False
+            return None
+        _njit_module = _kernels_njit
+    return _njit_module
+
+
+def apply_scale(values: Any, scale: float) -> np.ndarray:
+    """
+    Multiply an array by a conversion factor.
+
+    Args:
+        values: Array-like of values
+        scale: Multiplicative conversion factor
+
+    Returns:
+        New float64 array with the same shape as values
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    kernels = _njit_kernels(arr)
+    if kernels is not None:
+        flat = np.ascontiguousarray(arr).reshape(-1)
+        return kernels.scale_njit(flat, scale, np.empty_like(flat)).reshape(arr.shape)
+    return arr * scale
+
+
+def apply_affine(values: Any, scale: float, offset: float) -> np.ndarray:
+    """
+    Apply an affine conversion ``values * scale + offset`` to an array.
+
+    Args:
+        values: Array-like of values
+        scale: Multiplicative conversion factor
+        offset: Additive offset (non-zero for temperature scales like degC)
+
+    Returns:
+        New float64 array with the same shape as values
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    kernels = _njit_kernels(arr)
+    if kernels is not None:
+        flat = np.ascontiguousarray(arr).reshape(-1)
+        return kernels.affine_njit(flat, scale, offset, np.empty_like(flat)).reshape(arr.shape)
+    return arr * scale + offset
@@ -0,0 +1,29 @@
+"""
+Numba JIT kernels used by _kernels for large arrays.
+
+Importing Numba takes a few hundred milliseconds, so this module is only
+imported by _kernels the first time an array large enough to use it is
+converted.
+"""
+
+from __future__ import annotations
+
+from numba import njit, prange
+
+# Options shared by every kernel. cache=True stores the compiled machine code
+# next to this module, so only the first run on a machine pays for compilation
+NJIT_OPTIONS = {"cache": True, "parallel": True, "fastmath": True}
+
+
+@njit("float64[:](float64[:], float64, float64[:])", **NJIT_OPTIONS)
+def scale_njit(values, scale, out):  # type: ignore[no-untyped-def]
+    for i in prange(values.size):
+        out[i] = values[i] * scale
+    return out
+
+
+@njit("float64[:](float64[:], float64, float64, float64[:])", **NJIT_OPTIONS)
+def affine_njit(values, scale, offset, out):  # type: ignore[no-untyped-def]
+    for i in prange(values.size):
+        out[i] = values[i] * scale + offset
+    return out
@@ -0,0 +1,39 @@
+"""
+Units shared by the field type table and the standard field definitions.
+
+Each ``ureg.a / ureg.b**n`` expression builds a new pint Unit and runs its
+dimensional bookkeeping, so compound units used by field_types and the physics
+modules are built once here and reused wherever they are needed.
+"""
+
+from __future__ import annotations
+
+from .field import ureg
+
+# Simple units used by many fields (each ``ureg.<name>`` access builds a new Unit)
+PA = ureg.pascal
+DIMENSIONLESS = ureg.dimensionless
+
+# Geometry and kinematics
+M2 = ureg.meter**2
+M3 = ureg.meter**3
+M_PER_S = ureg.meter / ureg.second
+M3_PER_S = M3 / ureg.second
+KG_PER_S = ureg.kilogram / ureg.second
+RAD_PER_S = ureg.radian / ureg.second
+
+# Electromagnetism
+V_PER_M = ureg.volt / ureg.meter
+A_PER_M2 = ureg.ampere / M2
+OHM_M = ureg.ohm * ureg.meter
+S_PER_M = ureg.siemens / ureg.meter
+W_PER_M2 = ureg.watt / M2
+
+# Material properties
+KG_PER_M3 = ureg.kilogram / M3
+PA_S = PA * ureg.second
+M2_PER_S = M2 / ureg.second
+W_PER_MK = ureg.watt / (ureg.meter * ureg.kelvin)
+W_PER_M2K = ureg.watt / (M2 * ureg.kelvin)
+J_PER_KGK = ureg.joule / (ureg.kilogram * ureg.kelvin)
+INV_K = 1 / ureg.kelvin
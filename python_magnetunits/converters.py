@@ -4,30 +4,55 @@ Unit conversion utilities for field values and arrays.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import functools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
-from .field import ureg
+import numpy as np
+
+from . import _kernels
+from .field import (
+    _affine_coefficients,
+    _conversion_factor,
+    _is_offset_unit,
+    _resolve_unit,
+    ureg,
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_unit(unit: Any, pretty: bool) -> str:
+    """Format a pint Unit with the ``~P`` (pretty) or ``P`` spec, memoized."""
+    return f"{unit:~P}" if pretty else f"{unit:P}"
+
+
+# Values of these types are converted with plain arithmetic; anything else is
+# treated as a sequence and converted by the _kernels in one vectorized pass
+_SCALAR_TYPES = (int, float, np.generic)
 
 
 def convert_data(
     field_units: Dict[str, List[Any]],
-    values: Union[List[float], float],
+    values: Union[Sequence[float], np.ndarray, float],
     fieldname: str,
-) -> Union[List[float], float]:
+) -> Union[List[float], np.ndarray, float]:
     """
     Convert field values from input unit to output unit.
 
     Maintains backwards compatibility with magnetrun's field_units dict format:
         field_units = {"fieldname": [input_unit, output_unit]}
 
+    Each (input_unit, output_unit) pair is reduced once to a factor and offset,
+    so repeated calls with the same field_units skip pint entirely.
+
     Args:
         field_units: Dict mapping field names to [input_unit, output_unit] pairs
-        values: Single value or list of values to convert (in input unit)
+        values: Single value, list, tuple or NumPy array to convert (in input unit)
         fieldname: Name of the field to convert
 
     Returns:
-        Converted value(s) in output unit. Returns input value(s) unchanged
-        if fieldname is not in field_units dict.
+        Converted value(s) in output unit: a list for list input, a NumPy
+        array for other sequences, a scalar for scalar input. Returns input
+        value(s) unchanged if fieldname is not in field_units dict.
 
     Raises:
         KeyError: If fieldname not found in field_units
@@ -47,24 +72,75 @@ def convert_data(
         return values
 
     input_unit, output_unit = field_units[fieldname]
+    factor, offset = _affine_coefficients(_resolve_unit(input_unit), _resolve_unit(output_unit))
+
+    if isinstance(values, _SCALAR_TYPES):
+        return values * factor + offset
+    converted = _kernels.apply_affine(values, factor, offset)
+    return converted.tolist() if isinstance(values, list) else converted
+
 
-    # Handle both single values and lists
-    is_list = isinstance(values, list)
-    vals = values if is_list else [values]
+def _make_converter(factor: float, offset: float) -> Callable[[Any], Any]:
+    """Build a converter closure specialized for a fixed factor and offset."""
+    if offset == 0.0:
 
-    converted = []
-    for val in vals:
-        quantity = ureg.Quantity(val, input_unit)
-        converted.append(quantity.to(output_unit).magnitude)
+        def convert(values: Any) -> Any:
+            if isinstance(values, _SCALAR_TYPES):
+                return values * factor
+            converted = _kernels.apply_scale(values, factor)
+            return converted.tolist() if isinstance(values, list) else converted
 
-    return converted if is_list else converted[0]
+    else:
+
+        def convert(values: Any) -> Any:
+            if isinstance(values, _SCALAR_TYPES):
+                return values * factor + offset
+            converted = _kernels.apply_affine(values, factor, offset)
+            return converted.tolist() if isinstance(values, list) else converted
+
+    return convert
+
+
+def compile_field_units(
+    field_units: Dict[str, List[Any]],
+) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Precompile a magnetrun field_units dict into per-field converter functions.
+
+    Each [input_unit, output_unit] pair is resolved through pint once; the
+    returned callables then convert with a plain multiply (plus an offset for
+    temperature scales), with the same value handling as convert_data():
+    lists give lists, scalars stay scalars, other sequences give NumPy arrays.
+
+    Args:
+        field_units: Dict mapping field names to [input_unit, output_unit] pairs
+
+    Returns:
+        Dict mapping each field name to a converter function
+
+    Raises:
+        pint.DimensionalityError: If a unit pair is incompatible
+
+    Example:
+        >>> converters = compile_field_units({"MagneticField": ["tesla", "millitesla"]})
+        >>> converters["MagneticField"](1.5)
+        1500.0
+        >>> converters["MagneticField"]([1.0, 2.0])
+        [1000.0, 2000.0]
+    """
+    return {
+        fieldname: _make_converter(
+            *_affine_coefficients(_resolve_unit(input_unit), _resolve_unit(output_unit))
+        )
+        for fieldname, (input_unit, output_unit) in field_units.items()
+    }
 
 
 def convert_value(
-    value: float,
+    value: Union[float, Sequence[float], np.ndarray],
     from_unit: Union[str, Any],
     to_unit: Union[str, Any],
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Convert a single value between units.
 
@@ -72,12 +148,12 @@ def convert_value(
     the context of a specific field.
 
     Args:
-        value: Value to convert
+        value: Value to convert; lists, tuples and arrays are also accepted
         from_unit: Source unit (string or pint Unit)
         to_unit: Target unit (string or pint Unit)
 
     Returns:
-        Converted value
+        Converted value (a NumPy array for sequence input)
 
     Raises:
         pint.DimensionalityError: If units are incompatible
@@ -89,31 +165,53 @@ def convert_value(
         >>> convert_value(100, "millimeter", "centimeter")
         10.0
     """
-    quantity = ureg.Quantity(value, from_unit)
-    return quantity.to(to_unit).magnitude
+    from_unit = _resolve_unit(from_unit)
+    to_unit = _resolve_unit(to_unit)
+    # Parsed unit strings are interned, so the same unit resolves to one object
+    if from_unit is to_unit:
+        if isinstance(value, _SCALAR_TYPES):
+            return float(value)
+        return np.asarray(value, dtype=np.float64)
+    if _is_offset_unit(from_unit):
+        return ureg.Quantity(value, from_unit).to(to_unit).magnitude
+    factor = _conversion_factor(from_unit, to_unit)
+    if isinstance(value, _SCALAR_TYPES):
+        return value * factor
+    return _kernels.apply_scale(value, factor)
 
 
 def convert_array(
-    values: List[float],
+    values: Union[Sequence[float], np.ndarray],
     from_unit: Union[str, Any],
     to_unit: Union[str, Any],
-) -> List[float]:
+) -> Union[List[float], np.ndarray]:
     """
     Convert an array of values between units.
 
+    The values are converted as a single NumPy-backed pint Quantity, so the
+    unit conversion is resolved once rather than per element.
+
     Args:
-        values: List of values to convert
+        values: List or array of values to convert
         from_unit: Source unit (string or pint Unit)
         to_unit: Target unit (string or pint Unit)
 
     Returns:
-        List of converted values
+        Converted values: a list if values was a list, otherwise a NumPy array
 
     Example:
         >>> convert_array([1.0, 2.0], "meter", "centimeter")
         [100.0, 200.0]
     """
-    return [convert_value(v, from_unit, to_unit) for v in values]
+    from_unit = _resolve_unit(from_unit)
+    to_unit = _resolve_unit(to_unit)
+    if from_unit is to_unit:
+        # Same unit: copy, so the result never aliases the input array
+        converted = np.array(values, dtype=np.float64)
+    else:
+        arr = np.asarray(values, dtype=np.float64)
+        converted = ureg.Quantity(arr, from_unit).to(to_unit).magnitude
+    return converted.tolist() if isinstance(values, list) else converted
 
 
 def get_unit_string(unit: Union[str, Any], pretty: bool = True) -> str:
@@ -138,10 +236,8 @@ def get_unit_string(unit: Union[str, Any], pretty: bool = True) -> str:
     if isinstance(unit, str):
         return unit
 
-    if pretty:
-        return f"{unit:~P}"  # Pretty format with ~P
-    else:
-        return f"{unit:P}"  # Compact format
+    # Pretty format with ~P, compact format with P
+    return _format_unit(unit, pretty)
 
 
 def are_compatible(
@@ -167,10 +263,13 @@ def are_compatible(
         False
     """
     try:
-        u1 = ureg(unit1) if isinstance(unit1, str) else unit1
-        u2 = ureg(unit2) if isinstance(unit2, str) else unit2
+        u1 = _resolve_unit(unit1)
+        u2 = _resolve_unit(unit2)
         # Try to convert from u1 to u2
-        ureg.Quantity(1, u1).to(u2)
+        if not _is_offset_unit(u1):
+            _conversion_factor(u1, u2)
+        else:
+            ureg.Quantity(1, u1).to(u2)
         return True
     except (TypeError, ValueError):
         return False
@@ -4,20 +4,49 @@ Core Field class for representing physical fields with units and metadata.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field as dc_field
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+import functools
+import math
+import sys
+from dataclasses import dataclass, field as dc_field, fields as dc_fields
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from pint import UnitRegistry
 
+from . import _kernels
+
 if TYPE_CHECKING:
     from .field_types import FieldType
 
+# Use __slots__ on dataclasses where supported (dataclass(slots=True) needs Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Maximum number of formatted labels kept per Field (oldest entries evicted first)
+_LABEL_CACHE_SIZE = 256
+
+# Cached coefficients for a unit string naming a field's own unit (no conversion)
+_SAME_UNIT: Tuple[float, float] = (1.0, 0.0)
+
+# Canonical Unit object per unit, shared by every Field using that unit. Keyed by
+# the Unit's UnitsContainer, which hashes in ~0.2 us where str(unit) takes ~12 us.
+# Only Units of ``ureg`` are interned (a UnitsContainer does not identify its
+# registry), and at most _UNIT_INTERN_MAX of them; past that Units are used as given
+_UNIT_INTERN: Dict[Any, Any] = {}
+_UNIT_INTERN_MAX = 1024
+
 # Module-level singleton instance
 _global_ureg: Optional[UnitRegistry] = None
 
 
 def get_global_ureg() -> UnitRegistry:
-    """Get the global UnitRegistry instance (singleton pattern)."""
+    """
+    Get the global UnitRegistry instance (singleton pattern).
+
+    pint's application registry is left untouched. Fields pickle their unit
+    by name, so they are always restored into this registry; applications that
+    also pickle bare Units or Quantities can share it with
+    ``pint.set_application_registry(get_global_ureg())``.
+    """
     global _global_ureg
     if _global_ureg is None:
         _global_ureg = UnitRegistry(system="SI")
@@ -33,7 +62,90 @@ def get_global_ureg() -> UnitRegistry:
 ureg = get_global_ureg()
 
 
-@dataclass
+@functools.lru_cache(maxsize=1024)
+def _parse_unit(unit_str: str) -> Any:
+    """
+    Parse a unit string into a pint Unit, memoizing the result.
+
+    pint's string parser is comparatively expensive, and the same unit strings
+    ("tesla", "millitesla", ...) are parsed over and over. If units are
+    (re)defined on ``ureg`` after import, call ``_parse_unit.cache_clear()`` so
+    that strings parsed before the redefinition are resolved again.
+
+    The returned Unit is the canonical (interned) instance for that unit, so it
+    is identical to the ``unit`` of any Field defined with the same unit.
+    """
+    return _intern_unit(ureg.Unit(unit_str))
+
+
+def _intern_unit(unit: Any) -> Any:
+    """Return the canonical Unit equal to a ``ureg`` Unit; anything else passes through."""
+    if not isinstance(unit, ureg.Unit) or unit._REGISTRY is not ureg:
+        return unit
+    interned = _UNIT_INTERN.get(unit._units)
+    if interned is None:
+        if len(_UNIT_INTERN) >= _UNIT_INTERN_MAX:
+            return unit
+        interned = _UNIT_INTERN[unit._units] = unit
+    return interned
+
+
+@functools.lru_cache(maxsize=512)
+def _pretty(unit: Any) -> str:
+    """Return pint's abbreviated pretty form (``~P``) of a Unit, memoized."""
+    return f"{unit:~P}"
+
+
+def _resolve_unit(unit: Union[str, Any]) -> Any:
+    """Return the canonical pint Unit for a unit string or Unit."""
+    # Units are interned like parsed strings, so a unit resolves to the same
+    # object whether it is given by name or as a Unit
+    return _parse_unit(unit) if isinstance(unit, str) else _intern_unit(unit)
+
+
+def _is_offset_unit(unit: Any) -> bool:
+    """Return True if conversions from/to unit may involve an offset (temperature)."""
+    return "[temperature]" in unit.dimensionality
+
+
+@functools.lru_cache(maxsize=256)
+def _dimension_signature(unit: Any) -> FrozenSet[Tuple[str, float]]:
+    """
+    Return a hashable signature of a Unit's dimensionality, memoized.
+
+    Two units are convertible into one another exactly when their signatures
+    are equal, which is far cheaper to test than a trial conversion.
+    """
+    return frozenset(unit.dimensionality.items())
+
+
+@functools.lru_cache(maxsize=1024)
+def _conversion_factor(from_unit: Any, to_unit: Any) -> float:
+    """
+    Return the multiplicative factor converting from_unit to to_unit, memoized.
+
+    Only valid for linear (non-offset) unit pairs; temperature conversions such
+    as kelvin <-> degC must go through pint.
+    """
+    return ureg.Quantity(1.0, from_unit).to(to_unit).magnitude
+
+
+@functools.lru_cache(maxsize=1024)
+def _affine_coefficients(from_unit: Any, to_unit: Any) -> Tuple[float, float]:
+    """
+    Return (factor, offset) such that ``to = from * factor + offset``, memoized.
+
+    The offset is non-zero only for offset temperature scales (degC, degF).
+    """
+    if not _is_offset_unit(from_unit):
+        return _conversion_factor(from_unit, to_unit), 0.0
+    # Scale from the ratio of kelvin factors (differencing two converted points
+    # would lose precision against the large offset)
+    factor = ureg.get_base_units(from_unit)[0] / ureg.get_base_units(to_unit)[0]
+    return factor, ureg.Quantity(0.0, from_unit).to(to_unit).magnitude
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Field:
     """
     Represents a physical field with units, symbols, and metadata.
@@ -43,6 +155,10 @@ class Field:
     exclusions. This provides type-safe field definitions with integrated unit conversion
     and formatting for scientific computing applications.
 
+    Fields are immutable once built, so they can be shared freely and used as
+    dict keys or set members; the hash is computed once and cached. On Python
+    3.10+ the class uses ``__slots__`` to keep large registries compact.
+
     Attributes:
         name: Unique identifier for the field (e.g., "MagneticField")
         symbol: Short symbol for display (e.g., "B")
@@ -50,8 +166,10 @@ class Field:
         field_type: Optional FieldType enum value for categorization and validation
         description: Optional human-readable description of the field
         latex_symbol: Optional LaTeX representation (e.g., r"$B$")
-        aliases: Alternative names for this field (for registry lookup)
-        exclude_regions: Regions/domains where this field doesn't apply
+        aliases: Alternative names for this field (for registry lookup); any
+            iterable is accepted and stored as a tuple
+        exclude_regions: Regions/domains where this field doesn't apply; any
+            iterable is accepted and stored as a tuple
         default_value: Optional default value in the field's unit
         metadata: Custom metadata dict for application-specific data
 
@@ -75,24 +193,74 @@ class Field:
     field_type: Optional["FieldType"] = None
     description: Optional[str] = None
     latex_symbol: Optional[str] = None
-    aliases: List[str] = dc_field(default_factory=list)
-    exclude_regions: List[str] = dc_field(default_factory=list)
+    aliases: Tuple[str, ...] = ()
+    exclude_regions: Tuple[str, ...] = ()
     default_value: Optional[float] = None
     metadata: dict[str, Any] = dc_field(default_factory=dict)
 
+    # Internal caches (not part of the public constructor or comparisons)
+    _factor_cache: Dict[Any, Tuple[float, float]] = dc_field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _label_cache: Dict[Tuple[Any, bool], str] = dc_field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _exclude_set: FrozenSet[str] = dc_field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    # True for temperature units, whose conversions may need an offset (K <-> degC)
+    _is_affine: bool = dc_field(default=False, init=False, repr=False, compare=False)
+    _hash: Optional[int] = dc_field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Convert string units to pint Units and validate field_type compatibility."""
-        # Convert string units to pint Units
-        if isinstance(self.unit, str):
-            self.unit = ureg.Unit(self.unit)
-        
+        # The dataclass is frozen, so normalized values are set through object.__setattr__
+        setattr_ = object.__setattr__
+
+        # Convert string units to pint Units, sharing one Unit object per
+        # distinct unit across all fields (parsed strings are already canonical)
+        unit = self.unit
+        if isinstance(unit, str):
+            unit = _parse_unit(unit)
+        else:
+            unit = _intern_unit(unit)
+        setattr_(self, "unit", unit)
+
+        setattr_(self, "_is_affine", _is_offset_unit(unit))
+
+        # Intern short identifier strings used as lookup keys
+        setattr_(self, "name", sys.intern(self.name))
+        setattr_(self, "symbol", sys.intern(self.symbol))
+
+        # Metadata values such as categories repeat across many fields; the dict
+        # is copied so the caller's own dict is left untouched
+        setattr_(
+            self,
+            "metadata",
+            {
+                key: sys.intern(value) if type(value) is str else value
+                for key, value in self.metadata.items()
+            },
+        )
+
+        # Aliases and exclusions are fixed once the field is built (they key
+        # registry lookups)
+        setattr_(self, "aliases", tuple(self.aliases))
+        setattr_(self, "exclude_regions", tuple(self.exclude_regions))
+
+        # Set view of exclude_regions for O(1) region checks
+        setattr_(self, "_exclude_set", frozenset(self.exclude_regions))
+
         # Default latex_symbol to symbol if not provided
         if self.latex_symbol is None:
-            self.latex_symbol = self.symbol
-        
+            setattr_(self, "latex_symbol", self.symbol)
+        elif self.latex_symbol.isascii():
+            setattr_(self, "latex_symbol", sys.intern(self.latex_symbol))
+
         # Validate unit compatibility with field_type if provided
+        # (compares memoized dimensionality signatures instead of trying a conversion)
         if self.field_type is not None:
-            if not self.field_type.is_compatible(self.unit):
+            if _dimension_signature(unit) != _dimension_signature(self.field_type.default_unit):
                 raise ValueError(
                     f"Unit '{self.unit}' is not compatible with field_type "
                     f"'{self.field_type.name}' (expected dimensionality of "
@@ -152,16 +320,26 @@ class Field:
             **kwargs,
         )
 
-    def convert(self, value: float, to_unit: Union[str, Any]) -> float:
+    def convert(
+        self, value: Union[float, Sequence[float], np.ndarray], to_unit: Union[str, Any]
+    ) -> Union[float, np.ndarray]:
         """
         Convert a value from this field's unit to a target unit.
 
+        The scale factor and offset to each target unit are computed once by pint
+        and cached on the field (keyed by the target unit as passed, string or
+        Unit), so repeated conversions reduce to one dict lookup and a single
+        multiply-add (the offset is non-zero only for temperature scales).
+        Converting to the field's own unit returns the value unchanged. Lists,
+        tuples and arrays are converted with convert_array().
+
         Args:
-            value: The value to convert (in this field's unit)
+            value: The value to convert (in this field's unit), a scalar or a
+                sequence/array of values
             to_unit: Target unit (string or pint Unit)
 
         Returns:
-            Converted value in the target unit
+            Converted value in the target unit (a NumPy array for sequence input)
 
         Raises:
             pint.DimensionalityError: If units are incompatible
@@ -172,31 +350,114 @@ class Field:
             >>> field.convert(1.0, "gauss")
             10000.0
         """
-        quantity = ureg.Quantity(value, self.unit)
-        return quantity.to(to_unit).magnitude
+        # Sequences need NumPy arithmetic; the type() test keeps floats on the fast path
+        if type(value) is not float and isinstance(value, (list, tuple, np.ndarray)):
+            return self.convert_array(value, to_unit)
+
+        # Identity check only: pint's Unit.__eq__ is slow, and an equal but
+        # distinct Unit falls through to a cached (1.0, 0.0) pair anyway
+        if to_unit is self.unit:
+            return value
+
+        # The cache is also keyed by unit strings as given, so repeated
+        # conversions to a named unit skip parsing entirely
+        coefficients = self._factor_cache.get(to_unit)
+        if coefficients is None:
+            coefficients = self._prime_conversion(to_unit)
+        if coefficients is _SAME_UNIT:
+            return value
+
+        factor, offset = coefficients
+        return value * factor + offset
+
+    def prime_conversion(self, to_unit: Union[str, Any]) -> None:
+        """
+        Precompute the conversion to a target unit ahead of the first convert().
+
+        The scale factor and offset are computed now and cached under to_unit
+        as given (string or Unit), so later convert() calls to that unit never
+        reach pint.
 
-    def convert_array(self, values: List[float], to_unit: Union[str, Any]) -> List[float]:
+        Args:
+            to_unit: Target unit (string or pint Unit)
+
+        Raises:
+            pint.DimensionalityError: If units are incompatible
+            pint.UndefinedUnitError: If unit string is not recognized
+
+        Example:
+            >>> field = Field("B", "B", "tesla")
+            >>> field.prime_conversion("millitesla")
+            >>> field.convert(1.5, "millitesla")
+            1500.0
+        """
+        self._prime_conversion(to_unit)
+
+    def _prime_conversion(self, to_unit: Union[str, Any]) -> Tuple[float, float]:
+        """Compute and cache the coefficients convert() uses for to_unit as given."""
+        unit = _resolve_unit(to_unit)
+        coefficients = _SAME_UNIT if unit is self.unit else self._coefficients(unit)
+        self._factor_cache[to_unit] = coefficients
+        return coefficients
+
+    def _coefficients(self, to_unit: Any) -> Tuple[float, float]:
+        """Return the cached (factor, offset) from this field's unit to to_unit."""
+        coefficients = self._factor_cache.get(to_unit)
+        if coefficients is None:
+            coefficients = _affine_coefficients(self.unit, to_unit)
+            self._factor_cache[to_unit] = coefficients
+        return coefficients
+
+    def convert_array(
+        self,
+        values: Union[Sequence[float], np.ndarray],
+        to_unit: Union[str, Any],
+        return_list: bool = False,
+    ) -> Union[np.ndarray, List[float]]:
         """
         Convert an array of values from this field's unit to a target unit.
 
+        The conversion is vectorized: the cached (factor, offset) for the target
+        unit is applied to the whole NumPy array in a single fused pass, using a
+        parallel Numba kernel for large arrays when Numba is installed. This
+        includes offset temperature scales such as kelvin -> degC.
+
         Args:
-            values: List of values to convert (in this field's unit)
+            values: Array-like of values to convert (in this field's unit)
             to_unit: Target unit (string or pint Unit)
+            return_list: If True, return a Python list instead of a NumPy array
 
         Returns:
-            List of converted values in the target unit
+            Converted values in the target unit (NumPy array by default)
 
         Example:
             >>> field = Field("B", "B", "tesla")
             >>> field.convert_array([1.0, 2.0, 3.0], "millitesla")
-            [1000.0, 2000.0, 3000.0]
+            array([1000., 2000., 3000.])
+            >>> field.convert_array([1.0, 2.0], "millitesla", return_list=True)
+            [1000.0, 2000.0]
         """
-        return [self.convert(v, to_unit) for v in values]
+        unit = _resolve_unit(to_unit)
+        if unit is self.unit:
+            # Same unit: copy, so the result never aliases the input array
+            converted = np.array(values, dtype=float)
+            return converted.tolist() if return_list else converted
+
+        factor, offset = self._coefficients(unit)
+        if self._is_affine:
+            converted = _kernels.apply_affine(values, factor, offset)
+        else:
+            converted = _kernels.apply_scale(values, factor)
+        return converted.tolist() if return_list else converted
 
     def validate_value(self, value: Any) -> bool:
         """
         Check if a value is compatible with this field's unit.
 
+        Plain numbers, NumPy scalars and numeric NumPy arrays are checked directly
+        without building a pint Quantity; non-finite numbers (NaN, inf) are rejected.
+        Other inputs fall back to constructing a Quantity in this field's unit.
+
         Args:
             value: Value to validate
 
@@ -210,6 +471,15 @@ class Field:
             >>> field.validate_value("invalid")
             False
         """
+        if isinstance(value, (float, np.floating)):
+            return math.isfinite(value)
+        # Integers are always finite; math.isfinite() overflows on very large ones
+        if isinstance(value, (int, np.integer)):
+            return True
+        if isinstance(value, np.ndarray):
+            return bool(np.issubdtype(value.dtype, np.number))
+        if value is None:
+            return False
         try:
             ureg.Quantity(value, self.unit)
             return True
@@ -241,12 +511,28 @@ class Field:
         sym = self.latex_symbol if use_latex else self.symbol
 
         if target_unit:
-            # Format unit using pint's pretty formatting
-            unit_obj = ureg.Unit(target_unit) if isinstance(target_unit, str) else target_unit
-            unit_str = f"{unit_obj:~P}"  # Pretty format
-            return f"{sym} [{unit_str}]"
+            # Strings and Units are both hashable, so either keys the cache as-is
+            key = (target_unit, use_latex)
+            label = self._label_cache.get(key)
+            if label is None:
+                # Format unit using pint's pretty formatting (shared across fields)
+                label = f"{sym} [{_pretty(_resolve_unit(target_unit))}]"
+                if len(self._label_cache) >= _LABEL_CACHE_SIZE:
+                    del self._label_cache[next(iter(self._label_cache))]
+                self._label_cache[key] = label
+            return label
         return sym
 
+    @property
+    def exclude_regions_set(self) -> FrozenSet[str]:
+        """
+        Excluded regions as a frozenset, for O(1) membership tests in filters.
+
+        Example:
+            >>> registry.list_fields(predicate=lambda f: "Air" in f.exclude_regions_set)
+        """
+        return self._exclude_set
+
     def applies_to_region(self, region: str) -> bool:
         """
         Check if this field is valid in a given region/domain.
@@ -264,7 +550,24 @@ class Field:
             >>> field.applies_to_region("vacuum")
             False
         """
-        return region not in self.exclude_regions
+        return region not in self._exclude_set
+
+    def __hash__(self) -> int:
+        """Hash on name, symbol and unit; computed once and cached."""
+        h = self._hash
+        if h is None:
+            h = hash((self.name, self.symbol, self.unit))
+            object.__setattr__(self, "_hash", h)
+        return h
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        """Pickle by constructor arguments, with a ``ureg`` unit stored by name."""
+        # A pickled pint Unit is restored into pint's application registry,
+        # which need not be ureg; the unit string is parsed back into ureg
+        args = [getattr(self, f.name) for f in dc_fields(self) if f.init]
+        if self.unit._REGISTRY is ureg:
+            args[2] = str(self.unit)
+        return type(self), tuple(args)
 
     def __repr__(self) -> str:
         """String representation of the Field."""
@@ -9,9 +9,28 @@ and symbol, and provides validation for unit compatibility.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, Tuple
 
-from .field import ureg
+from ._units import (
+    A_PER_M2,
+    INV_K,
+    J_PER_KGK,
+    KG_PER_M3,
+    M2,
+    M2_PER_S,
+    M3,
+    M3_PER_S,
+    M_PER_S,
+    OHM_M,
+    PA_S,
+    RAD_PER_S,
+    S_PER_M,
+    V_PER_M,
+    W_PER_M2,
+    W_PER_M2K,
+    W_PER_MK,
+)
+from .field import _dimension_signature, _resolve_unit, ureg
 
 
 class FieldType(Enum):
@@ -29,7 +48,7 @@ class FieldType(Enum):
         <Unit('tesla')>
         >>> ftype.default_symbol
         'B'
-        >>> ftype.is_compatible(ureg.gauss)
+        >>> ftype.is_compatible(ureg.Gauss)
         True
         >>> ftype.is_compatible(ureg.meter)
         False
@@ -97,25 +116,32 @@ class FieldType(Enum):
     VOLUME = "volume"
     INDEX = "index"
 
+    # The properties below read per-member attributes set once at import
+    # (see the end of this module) rather than looking up the tables each time
+
     @property
     def default_unit(self) -> Any:
         """Return default SI unit for this field type."""
-        return _FIELD_TYPE_UNITS[self]
+        return self._default_unit  # type: ignore[attr-defined]
 
     @property
     def default_symbol(self) -> str:
         """Return default symbol for this field type."""
-        return _FIELD_TYPE_SYMBOLS[self]
+        return self._default_symbol  # type: ignore[attr-defined]
 
     @property
     def latex_symbol(self) -> str:
         """Return default LaTeX symbol for this field type."""
-        return _FIELD_TYPE_LATEX[self]
+        return self._latex_symbol  # type: ignore[attr-defined]
 
     def is_compatible(self, unit: Any) -> bool:
         """
         Check if a unit is dimensionally compatible with this field type.
 
+        The unit's dimensionality signature is compared with the one precomputed
+        for this field type. The answer for each unit string is remembered per
+        field type, so format files repeating the same units skip the check.
+
         Args:
             unit: A pint unit or unit string to check
 
@@ -123,18 +149,24 @@ class FieldType(Enum):
             True if the unit has the same dimensionality as this field type
 
         Example:
-            >>> FieldType.MAGNETIC_FIELD.is_compatible("gauss")
+            >>> FieldType.MAGNETIC_FIELD.is_compatible("Gauss")
             True
             >>> FieldType.MAGNETIC_FIELD.is_compatible("meter")
             False
         """
+        compat: Dict[str, bool] = self._compat  # type: ignore[attr-defined]
+        if isinstance(unit, str):
+            result = compat.get(unit)
+            if result is not None:
+                return result
         try:
-            if isinstance(unit, str):
-                unit = ureg(unit)
-            ureg.Quantity(1, unit).to(self.default_unit)
-            return True
+            signature = _dimension_signature(_resolve_unit(unit))
+            result = signature == self._dims  # type: ignore[attr-defined]
         except Exception:
-            return False
+            result = False
+        if isinstance(unit, str) and len(compat) < _COMPAT_CACHE_SIZE:
+            compat[unit] = result
+        return result
 
 
 # === Default Units (SI base) ===
@@ -143,15 +175,15 @@ _FIELD_TYPE_UNITS: Dict[FieldType, Any] = {
     FieldType.TIME: ureg.second,
     # Electromagnetic Fields
     FieldType.MAGNETIC_FIELD: ureg.tesla,
-    FieldType.ELECTRIC_FIELD: ureg.volt / ureg.meter,
+    FieldType.ELECTRIC_FIELD: V_PER_M,
     FieldType.CURRENT: ureg.ampere,
-    FieldType.CURRENT_DENSITY: ureg.ampere / ureg.meter**2,
+    FieldType.CURRENT_DENSITY: A_PER_M2,
     FieldType.VOLTAGE: ureg.volt,
     # Electromagnetic Material Properties
     FieldType.RESISTANCE: ureg.ohm,
     FieldType.INDUCTANCE: ureg.henry,
-    FieldType.ELECTRICAL_RESISTIVITY: ureg.ohm * ureg.meter,
-    FieldType.ELECTRICAL_CONDUCTIVITY: ureg.siemens / ureg.meter,
+    FieldType.ELECTRICAL_RESISTIVITY: OHM_M,
+    FieldType.ELECTRICAL_CONDUCTIVITY: S_PER_M,
     FieldType.RELATIVE_PERMITTIVITY: ureg.dimensionless,
     FieldType.RELATIVE_PERMEABILITY: ureg.dimensionless,
     FieldType.MAGNETIC_SUSCEPTIBILITY: ureg.dimensionless,
@@ -160,35 +192,35 @@ _FIELD_TYPE_UNITS: Dict[FieldType, Any] = {
     FieldType.REACTIVE_POWER: ureg.var,
     # Thermal Fields
     FieldType.TEMPERATURE: ureg.kelvin,
-    FieldType.HEAT_FLUX: ureg.watt / ureg.meter**2,
+    FieldType.HEAT_FLUX: W_PER_M2,
     # Thermal Material Properties
-    FieldType.THERMAL_CONDUCTIVITY: ureg.watt / (ureg.meter * ureg.kelvin),
-    FieldType.HEAT_TRANSFER_COEFFICIENT: ureg.watt / (ureg.meter**2 * ureg.kelvin),
-    FieldType.SPECIFIC_HEAT: ureg.joule / (ureg.kilogram * ureg.kelvin),
-    FieldType.THERMAL_EXPANSION: 1 / ureg.kelvin,
-    FieldType.THERMAL_DIFFUSIVITY: ureg.meter**2 / ureg.second,
+    FieldType.THERMAL_CONDUCTIVITY: W_PER_MK,
+    FieldType.HEAT_TRANSFER_COEFFICIENT: W_PER_M2K,
+    FieldType.SPECIFIC_HEAT: J_PER_KGK,
+    FieldType.THERMAL_EXPANSION: INV_K,
+    FieldType.THERMAL_DIFFUSIVITY: M2_PER_S,
     # Hydraulics / Thermohydraulics
     FieldType.PRESSURE: ureg.pascal,
-    FieldType.FLOW_RATE: ureg.meter**3 / ureg.second,
-    FieldType.VELOCITY: ureg.meter / ureg.second,
-    FieldType.DYNAMIC_VISCOSITY: ureg.pascal * ureg.second,
-    FieldType.KINEMATIC_VISCOSITY: ureg.meter**2 / ureg.second,
+    FieldType.FLOW_RATE: M3_PER_S,
+    FieldType.VELOCITY: M_PER_S,
+    FieldType.DYNAMIC_VISCOSITY: PA_S,
+    FieldType.KINEMATIC_VISCOSITY: M2_PER_S,
     # Mechanical Fields
     FieldType.FORCE: ureg.newton,
     FieldType.STRESS: ureg.pascal,
     FieldType.STRAIN: ureg.dimensionless,
     # Mechanical Material Properties
-    FieldType.DENSITY: ureg.kilogram / ureg.meter**3,
+    FieldType.DENSITY: KG_PER_M3,
     FieldType.YOUNG_MODULUS: ureg.pascal,
     FieldType.POISSON_RATIO: ureg.dimensionless,
     # Other
-    FieldType.ROTATION_SPEED: ureg.radian / ureg.second,
+    FieldType.ROTATION_SPEED: RAD_PER_S,
     FieldType.PERCENTAGE: ureg.percent,
     # Geometry
     FieldType.COORDINATE: ureg.meter,
     FieldType.LENGTH: ureg.meter,
-    FieldType.AREA: ureg.meter**2,
-    FieldType.VOLUME: ureg.meter**3,
+    FieldType.AREA: M2,
+    FieldType.VOLUME: M3,
     FieldType.INDEX: ureg.dimensionless,
 }
 
@@ -301,3 +333,20 @@ _FIELD_TYPE_LATEX: Dict[FieldType, str] = {
     FieldType.VOLUME: r"$V$",
     FieldType.INDEX: r"$i$",
 }
+
+# Maximum number of unit strings whose is_compatible() answer is kept per FieldType
+_COMPAT_CACHE_SIZE = 256
+
+# === Dimensionality signatures of the default units (for is_compatible) ===
+_FIELD_TYPE_DIMS: Dict[FieldType, FrozenSet[Tuple[str, float]]] = {
+    field_type: _dimension_signature(unit) for field_type, unit in _FIELD_TYPE_UNITS.items()
+}
+
+# Attach the table entries to each member so property access is a plain attribute load
+for _field_type in FieldType:
+    _field_type._default_unit = _FIELD_TYPE_UNITS[_field_type]  # type: ignore[attr-defined]
+    _field_type._default_symbol = _FIELD_TYPE_SYMBOLS[_field_type]  # type: ignore[attr-defined]
+    _field_type._latex_symbol = _FIELD_TYPE_LATEX[_field_type]  # type: ignore[attr-defined]
+    _field_type._dims = _FIELD_TYPE_DIMS[_field_type]  # type: ignore[attr-defined]
+    _field_type._compat = {}  # type: ignore[attr-defined]
+del _field_type
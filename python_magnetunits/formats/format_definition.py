@@ -7,11 +7,21 @@ This module provides the FormatDefinition class which represents a data file for
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field as dc_field
+import json
+import sys
+import warnings
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from ..field import Field, ureg
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (faster JSON parsing)
+    orjson = None
+
+from ..field import _DATACLASS_SLOTS, Field, ureg
 from ..field_types import FieldType
 from ..registry import FieldRegistry
 
@@ -58,10 +68,61 @@ UNIT_ALIASES: Dict[str, str] = {
 }
 
 
+# FieldType members by their string value (avoids Enum.__call__ and its ValueError on misses)
+_FIELD_TYPE_BY_VALUE: Dict[str, FieldType] = {ft.value: ft for ft in FieldType}
+
+
+# PyYAML module once imported by _import_yaml() (YAML support is optional)
+_yaml: Any = None
+
+
+def _import_yaml() -> Any:
+    """Import PyYAML on first use and cache the module."""
+    global _yaml
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required to load YAML files: pip install pyyaml")
+        _yaml = yaml
+    return _yaml
+
+
+def _parse_json(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when it is installed.
+
+    Parsing bytes skips decoding the file to a str first. Documents orjson
+    rejects but the standard parser accepts (e.g. NaN literals) fall back to
+    the json module, which also reports genuine syntax errors.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string read from a format file (None, "" and non-strings pass through)."""
+    return sys.intern(value) if value and type(value) is str else value
+
+
+def _as_tuple(values: Any) -> Any:
+    """Return a JSON list as a tuple; null gives (), other values pass through."""
+    if values is None:
+        return ()
+    return tuple(values) if isinstance(values, (list, tuple)) else values
+
+
 def normalize_unit(unit_str: str) -> str:
     """
     Normalize a unit string to pint-compatible format.
 
+    Lookups always reflect the current contents of UNIT_ALIASES, so aliases
+    added at runtime take effect immediately (no result caching).
+
     Args:
         unit_str: Unit string from JSON (e.g., "celsius", "bar")
 
@@ -81,13 +142,10 @@ def get_field_type(field_type_str: str) -> Optional[FieldType]:
     Returns:
         FieldType enum value, or None if not found
     """
-    try:
-        return FieldType(field_type_str)
-    except ValueError:
-        return None
+    return _FIELD_TYPE_BY_VALUE.get(field_type_str)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FieldDefinition:
     """
     Represents a single field definition from a format file.
@@ -101,8 +159,8 @@ class FieldDefinition:
     symbol: Optional[str] = None
     description: Optional[str] = None
     latex_symbol: Optional[str] = None
-    aliases: List[str] = dc_field(default_factory=list)
-    exclude_regions: List[str] = dc_field(default_factory=list)
+    aliases: Tuple[str, ...] = ()
+    exclude_regions: Tuple[str, ...] = ()
 
     def to_field(self) -> Field:
         """
@@ -117,7 +175,6 @@ class FieldDefinition:
         # Get FieldType if specified
         ftype = get_field_type(self.field_type) if self.field_type else None
 
-        # Normalize unit
         unit = normalize_unit(self.unit)
 
         # Use name as symbol if not specified
@@ -127,7 +184,6 @@ class FieldDefinition:
         if ftype is not None:
             if not ftype.is_compatible(unit):
                 # Create field without field_type to avoid validation error
-                import warnings
                 warnings.warn(
                     f"Field '{self.name}': unit '{unit}' incompatible with "
                     f"field_type '{self.field_type}', creating without type validation"
@@ -156,25 +212,28 @@ class FieldDefinition:
         Returns:
             FieldDefinition object
         """
+        # Column names, types, units and symbols repeat across formats and key
+        # dict lookups, so they are interned. Malformed values are passed on
+        # as given, so only that field fails (with a warning) in to_field()
         return cls(
-            name=data["name"],
-            field_type=data.get("field_type"),
-            unit=data.get("unit", "dimensionless"),
-            symbol=data.get("symbol"),
+            name=_intern(data["name"]),
+            field_type=_intern(data.get("field_type")),
+            unit=_intern(data.get("unit") or "dimensionless"),
+            symbol=_intern(data.get("symbol")),
             description=data.get("description"),
             latex_symbol=data.get("latex_symbol"),
-            aliases=data.get("aliases", []),
-            exclude_regions=data.get("exclude_regions", []),
+            aliases=_as_tuple(data.get("aliases")),
+            exclude_regions=_as_tuple(data.get("exclude_regions")),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FormatMetadata:
     """Metadata about the file format."""
 
     description: str = ""
     file_extension: str = ".txt"
-    delimiter: str = "\t"
+    delimiter: Optional[str] = "\t"  # None: columns aligned by any run of whitespace
     header_row: bool = True
     encoding: str = "utf-8"
     skip_rows: int = 0
@@ -234,23 +293,34 @@ class FormatDefinition:
 
         # Internal storage
         self._fields: Dict[str, Field] = {}  # column_name -> Field
-        self._registry: FieldRegistry = FieldRegistry()
+        self._fields_by_type: Dict[Optional[FieldType], List[Field]] = {}  # None for untyped
+        self._fields_dicts: Optional[List[Dict[str, Any]]] = None  # to_dict() "fields", built once
+        self._registry: Optional[FieldRegistry] = None  # built on first symbol lookup
 
         # Build fields from definitions
         self._build_fields()
 
     def _build_fields(self) -> None:
-        """Convert field definitions to Field objects and register them."""
-        import warnings
-        
+        """Convert field definitions to Field objects and index them."""
+        # Build every field first (only failures pay for the warning), then
+        # index them in one batch. The FieldRegistry is only needed for symbol
+        # and alias lookups, so it is built lazily by the registry property
+        fields: List[Field] = []
         for defn in self._field_definitions:
             try:
-                field = defn.to_field()
-                self._fields[defn.name] = field
-                self._registry.register(field)
+                fields.append(defn.to_field())
             except Exception as e:
                 warnings.warn(f"Could not create field '{defn.name}': {e}")
 
+        # Field names are the column names; later definitions of a column win
+        self._fields = {field.name: field for field in fields}
+        self._registry = None
+
+        by_type: Dict[Optional[FieldType], List[Field]] = {}
+        for field in self._fields.values():
+            by_type.setdefault(field.field_type, []).append(field)
+        self._fields_by_type = by_type
+
     def get_field(self, column_name: str) -> Optional[Field]:
         """
         Get a Field by its column name in the data file.
@@ -273,11 +343,15 @@ class FormatDefinition:
         Returns:
             Field object if found, None otherwise
         """
-        return self._registry.get(symbol)
+        return self.registry.get(symbol)
 
     @property
     def registry(self) -> FieldRegistry:
-        """Get the internal FieldRegistry with all fields."""
+        """Get the internal FieldRegistry with all fields (built on first access)."""
+        if self._registry is None:
+            registry = FieldRegistry()
+            registry.bulk_register(self._fields.values())
+            self._registry = registry
         return self._registry
 
     @property
@@ -294,6 +368,105 @@ class FormatDefinition:
         """Check if a column name is defined in this format."""
         return column_name in self._fields
 
+    def convert_column(
+        self,
+        column_name: str,
+        values: Union[Sequence[float], np.ndarray],
+        target_unit: Union[str, Any],
+    ) -> np.ndarray:
+        """
+        Convert a whole data column from its file unit to a target unit.
+
+        The column's scale factor and offset are resolved once and applied to the
+        full array in one vectorized pass (a parallel Numba kernel for large
+        columns when Numba is installed), including offset temperature scales.
+
+        Args:
+            column_name: Column name as it appears in the data file
+            values: Column values, in the unit declared for the column
+            target_unit: Target unit (string or pint Unit)
+
+        Returns:
+            NumPy array of converted values
+
+        Raises:
+            KeyError: If the column is not defined in this format
+            pint.DimensionalityError: If the target unit is incompatible
+
+        Example:
+            >>> fmt = FormatDefinition.from_json("pupitre.json")
+            >>> fmt.convert_column("Field", np.array([1.0, 1.5]), "Gauss")
+            array([10000., 15000.])
+        """
+        field = self._fields.get(column_name)
+        if field is None:
+            raise KeyError(f"Column '{column_name}' is not defined in format '{self.format_name}'")
+        return field.convert_array(values, target_unit)
+
+    def load_file(
+        self,
+        path: Union[str, Path],
+        units: Optional[Dict[str, Union[str, Any]]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Load a numeric data file written in this format.
+
+        The file is read according to the format metadata (delimiter, encoding,
+        skip_rows, comment_char, header_row) into one NumPy array per column.
+        The declared delimiter is used as is; a delimiter of None means columns
+        separated by any run of whitespace. Without a header row, the file's
+        columns must appear in the same order as the format's field definitions.
+        Columns listed in ``units`` are converted with convert_column(), so each
+        column is scaled in a single vectorized pass.
+
+        Args:
+            path: Path to the data file
+            units: Optional mapping of column name to target unit
+
+        Returns:
+            Dictionary mapping column names to float64 arrays
+
+        Raises:
+            KeyError: If a column in units is not defined in this format
+            ValueError: If the file contains non-numeric data, or if its number of
+                columns differs from the header (or, without a header, from the
+                number of field definitions)
+            pint.DimensionalityError: If a target unit is incompatible
+
+        Example:
+            >>> fmt = FormatDefinition.from_json("pupitre.json")
+            >>> data = fmt.load_file("M9_run.txt", units={"Field": "Gauss"})
+            >>> data["Field"][:2]
+            array([10000., 15000.])
+        """
+        meta = self.metadata
+        # str.split() and loadtxt() both split on any whitespace run for None
+        delimiter = meta.delimiter
+        with open(path, "r", encoding=meta.encoding) as f:
+            for _ in range(meta.skip_rows):
+                f.readline()
+            if meta.header_row:
+                names = [name.strip() for name in f.readline().rstrip("\r\n").split(delimiter)]
+            else:
+                names = self.column_names
+            table = np.loadtxt(
+                f, dtype=np.float64, delimiter=delimiter, comments=meta.comment_char, ndmin=2
+            )
+
+        if table.size == 0:
+            table = table.reshape(0, len(names))
+        if table.shape[1] != len(names):
+            source = "header" if meta.header_row else "field definitions"
+            raise ValueError(
+                f"'{path}' has {table.shape[1]} data columns but the {source} of format "
+                f"'{self.format_name}' name {len(names)}"
+            )
+
+        data = {name: table[:, i] for i, name in enumerate(names)}
+        for column_name, target_unit in (units or {}).items():
+            data[column_name] = self.convert_column(column_name, data[column_name], target_unit)
+        return data
+
     def list_fields_by_type(self, field_type: FieldType) -> List[Field]:
         """
         List all fields of a specific FieldType.
@@ -304,15 +477,31 @@ class FormatDefinition:
         Returns:
             List of fields matching the type
         """
-        return [f for f in self._fields.values() if f.field_type == field_type]
+        return list(self._fields_by_type.get(field_type, ()))
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the format definition back to a dictionary.
 
+        The field definitions cannot change after construction, so the per-field
+        dicts are built once, on the first call; every call returns a new
+        ``"fields"`` list of fresh copies, which callers may modify freely. The
+        format name and metadata are read fresh on every call.
+
         Returns:
             Dictionary representation suitable for JSON serialization
         """
+        if self._fields_dicts is None:
+            self._fields_dicts = [
+                {
+                    "name": defn.name,
+                    "field_type": defn.field_type,
+                    "unit": defn.unit,
+                    "symbol": defn.symbol,
+                    "description": defn.description,
+                }
+                for defn in self._field_definitions
+            ]
         return {
             "format_name": self.format_name,
             "metadata": {
@@ -324,16 +513,8 @@ class FormatDefinition:
                 "skip_rows": self.metadata.skip_rows,
                 "comment_char": self.metadata.comment_char,
             },
-            "fields": [
-                {
-                    "name": defn.name,
-                    "field_type": defn.field_type,
-                    "unit": defn.unit,
-                    "symbol": defn.symbol,
-                    "description": defn.description,
-                }
-                for defn in self._field_definitions
-            ],
+            # Shallow copies keep callers from mutating the cached entries
+            "fields": [dict(entry) for entry in self._fields_dicts],
         }
 
     @classmethod
@@ -379,11 +560,8 @@ class FormatDefinition:
             >>> fmt.format_name
             'pupitre'
         """
-        import json
-
-        path = Path(path)
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _parse_json(f.read())
         return cls.from_dict(data)
 
     @classmethod
@@ -400,12 +578,8 @@ class FormatDefinition:
         Raises:
             ImportError: If PyYAML is not installed
         """
-        try:
-            import yaml
-        except ImportError:
-            raise ImportError("PyYAML is required to load YAML files: pip install pyyaml")
+        yaml = _import_yaml()
 
-        path = Path(path)
         with open(path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
         return cls.from_dict(data)
@@ -435,13 +609,11 @@ class FormatDefinition:
             "Field list:",
         ]
 
-        # Group by field_type
-        by_type: Dict[str, List[Field]] = {}
-        for field in self._fields.values():
-            type_name = field.field_type.name if field.field_type else "untyped"
-            if type_name not in by_type:
-                by_type[type_name] = []
-            by_type[type_name].append(field)
+        # Group by field_type (the grouping is built with the fields)
+        by_type = {
+            field_type.name if field_type else "untyped": fields
+            for field_type, fields in self._fields_by_type.items()
+        }
 
         for type_name, fields in sorted(by_type.items()):
             lines.append(f"  {type_name}:")
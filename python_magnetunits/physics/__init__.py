@@ -7,12 +7,15 @@ This package provides pre-defined field collections organized by physics domain:
 - thermal: Temperature, heat flux, thermal material properties
 - hydraulics: Pressure, flow rate, velocity, fluid properties
 - mechanical: Stress, strain, displacement, mechanical material properties
+
+Submodules are imported on first access, so ``from python_magnetunits.physics
+import thermal`` only builds the thermal fields.
 """
 
-from . import electromagnetic
-from . import thermal
-from . import hydraulics
-from . import mechanical
+from __future__ import annotations
+
+import importlib
+from typing import Any, List
 
 __all__ = [
     "electromagnetic",
@@ -21,3 +24,16 @@ __all__ = [
     "mechanical",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import a physics submodule on first access and cache it as a module global."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the submodules along with the already loaded globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,62 @@
+"""
+Helpers for building the standard field definitions.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from ..field import Field
+
+if TYPE_CHECKING:
+    from ..field_types import FieldType
+
+
+def vector_components(
+    name: str,
+    symbol: str,
+    unit: Any,
+    description: str,
+    category: str,
+    field_type: Optional[FieldType] = None,
+    alias: Optional[str] = None,
+) -> Tuple[Field, Field, Field]:
+    """
+    Build the x, y and z component Fields of a vector quantity.
+
+    Each component follows the naming used throughout the physics modules:
+    ``<name>_x``, ``<symbol>_x``, ``$<symbol>_x$`` and the aliases
+    ``<symbol>x``, ``<symbol>_x`` and ``<alias>_x``.
+
+    Args:
+        name: Name of the vector quantity (e.g., "MagneticField")
+        symbol: Symbol of the vector quantity (e.g., "B")
+        unit: Unit shared by all components
+        description: Description prefix (e.g., "Magnetic field")
+        category: Value of the "category" metadata entry
+        field_type: Optional FieldType shared by all components
+        alias: Optional snake_case alias prefix (e.g., "magnetic_field")
+
+    Returns:
+        Tuple of the x, y and z component Fields
+
+    Example:
+        >>> B_X, B_Y, B_Z = vector_components(
+        ...     "MagneticField", "B", ureg.tesla, "Magnetic field", "electromagnetic"
+        ... )
+        >>> B_X.aliases
+        ('Bx', 'B_x')
+    """
+    return tuple(  # type: ignore[return-value]
+        Field(
+            name=f"{name}_{c}",
+            symbol=f"{symbol}_{c}",
+            unit=unit,
+            field_type=field_type,
+            description=f"{description} {c}-component",
+            latex_symbol=f"${symbol}_{c}$",
+            aliases=(f"{symbol}{c}", f"{symbol}_{c}") + ((f"{alias}_{c}",) if alias else ()),
+            metadata={"category": category, "type": "component", "component": c},
+        )
+        for c in "xyz"
+    )
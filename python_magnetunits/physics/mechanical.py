@@ -10,14 +10,51 @@ Note: Density field has been removed from this module to avoid duplication.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Tuple
 
 from ..field import Field, ureg
 from ..field_types import FieldType
+from .._units import DIMENSIONLESS, PA
+from ._components import vector_components
 
 if TYPE_CHECKING:
     from ..registry import FieldRegistry
 
+__all__ = [
+    "FORCE",
+    "FORCE_X",
+    "FORCE_Y",
+    "FORCE_Z",
+    "STRESS",
+    "STRESS_XX",
+    "STRESS_YY",
+    "STRESS_ZZ",
+    "STRESS_XY",
+    "STRESS_XZ",
+    "STRESS_YZ",
+    "STRAIN",
+    "STRAIN_XX",
+    "STRAIN_YY",
+    "STRAIN_ZZ",
+    "DISPLACEMENT",
+    "DISPLACEMENT_X",
+    "DISPLACEMENT_Y",
+    "DISPLACEMENT_Z",
+    "YOUNG_MODULUS",
+    "POISSON_RATIO",
+    "FORCE_FIELDS",
+    "STRESS_FIELDS",
+    "STRAIN_FIELDS",
+    "DISPLACEMENT_FIELDS",
+    "MECHANICAL_MATERIAL_PROPERTIES",
+    "MECHANICAL_FIELDS",
+    "register_mechanical_fields",
+    "register_stress_fields",
+    "register_strain_fields",
+    "register_displacement_fields",
+    "register_mechanical_material_properties",
+]
+
 
 # =============================================================================
 # Force
@@ -30,41 +67,18 @@ FORCE = Field(
     field_type=FieldType.FORCE,
     description="Force magnitude",
     latex_symbol=r"$F$",
-    aliases=["F", "force"],
+    aliases=("F", "force"),
     metadata={"category": "mechanical", "type": "vector_magnitude"},
 )
 
-FORCE_X = Field(
-    name="Force_x",
-    symbol="F_x",
-    unit=ureg.newton,
-    field_type=FieldType.FORCE,
-    description="Force x-component",
-    latex_symbol=r"$F_x$",
-    aliases=["Fx", "F_x", "force_x"],
-    metadata={"category": "mechanical", "type": "component", "component": "x"},
-)
-
-FORCE_Y = Field(
-    name="Force_y",
-    symbol="F_y",
-    unit=ureg.newton,
-    field_type=FieldType.FORCE,
-    description="Force y-component",
-    latex_symbol=r"$F_y$",
-    aliases=["Fy", "F_y", "force_y"],
-    metadata={"category": "mechanical", "type": "component", "component": "y"},
-)
-
-FORCE_Z = Field(
-    name="Force_z",
-    symbol="F_z",
+FORCE_X, FORCE_Y, FORCE_Z = vector_components(
+    name="Force",
+    symbol="F",
     unit=ureg.newton,
     field_type=FieldType.FORCE,
-    description="Force z-component",
-    latex_symbol=r"$F_z$",
-    aliases=["Fz", "F_z", "force_z"],
-    metadata={"category": "mechanical", "type": "component", "component": "z"},
+    description="Force",
+    category="mechanical",
+    alias="force",
 )
 
 
@@ -75,77 +89,77 @@ FORCE_Z = Field(
 STRESS = Field(
     name="Stress",
     symbol="σ",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Stress (general / von Mises)",
     latex_symbol=r"$\sigma$",
-    aliases=["sigma", "stress", "von_mises_stress"],
+    aliases=("sigma", "stress", "von_mises_stress"),
     metadata={"category": "mechanical", "type": "tensor_scalar"},
 )
 
 STRESS_XX = Field(
     name="Stress_xx",
     symbol="σ_xx",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Normal stress xx-component",
     latex_symbol=r"$\sigma_{xx}$",
-    aliases=["sigma_xx", "stress_xx"],
+    aliases=("sigma_xx", "stress_xx"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "xx"},
 )
 
 STRESS_YY = Field(
     name="Stress_yy",
     symbol="σ_yy",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Normal stress yy-component",
     latex_symbol=r"$\sigma_{yy}$",
-    aliases=["sigma_yy", "stress_yy"],
+    aliases=("sigma_yy", "stress_yy"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "yy"},
 )
 
 STRESS_ZZ = Field(
     name="Stress_zz",
     symbol="σ_zz",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Normal stress zz-component",
     latex_symbol=r"$\sigma_{zz}$",
-    aliases=["sigma_zz", "stress_zz"],
+    aliases=("sigma_zz", "stress_zz"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "zz"},
 )
 
 STRESS_XY = Field(
     name="Stress_xy",
     symbol="σ_xy",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Shear stress xy-component",
     latex_symbol=r"$\sigma_{xy}$",
-    aliases=["sigma_xy", "stress_xy", "tau_xy"],
+    aliases=("sigma_xy", "stress_xy", "tau_xy"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "xy"},
 )
 
 STRESS_XZ = Field(
     name="Stress_xz",
     symbol="σ_xz",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Shear stress xz-component",
     latex_symbol=r"$\sigma_{xz}$",
-    aliases=["sigma_xz", "stress_xz", "tau_xz"],
+    aliases=("sigma_xz", "stress_xz", "tau_xz"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "xz"},
 )
 
 STRESS_YZ = Field(
     name="Stress_yz",
     symbol="σ_yz",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.STRESS,
     description="Shear stress yz-component",
     latex_symbol=r"$\sigma_{yz}$",
-    aliases=["sigma_yz", "stress_yz", "tau_yz"],
+    aliases=("sigma_yz", "stress_yz", "tau_yz"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "yz"},
 )
 
@@ -157,44 +171,44 @@ STRESS_YZ = Field(
 STRAIN = Field(
     name="Strain",
     symbol="ε",
-    unit=ureg.dimensionless,
+    unit=DIMENSIONLESS,
     field_type=FieldType.STRAIN,
     description="Strain (general / equivalent)",
     latex_symbol=r"$\varepsilon$",
-    aliases=["epsilon", "strain", "equivalent_strain"],
+    aliases=("epsilon", "strain", "equivalent_strain"),
     metadata={"category": "mechanical", "type": "tensor_scalar"},
 )
 
 STRAIN_XX = Field(
     name="Strain_xx",
     symbol="ε_xx",
-    unit=ureg.dimensionless,
+    unit=DIMENSIONLESS,
     field_type=FieldType.STRAIN,
     description="Normal strain xx-component",
     latex_symbol=r"$\varepsilon_{xx}$",
-    aliases=["epsilon_xx", "strain_xx"],
+    aliases=("epsilon_xx", "strain_xx"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "xx"},
 )
 
 STRAIN_YY = Field(
     name="Strain_yy",
     symbol="ε_yy",
-    unit=ureg.dimensionless,
+    unit=DIMENSIONLESS,
     field_type=FieldType.STRAIN,
     description="Normal strain yy-component",
     latex_symbol=r"$\varepsilon_{yy}$",
-    aliases=["epsilon_yy", "strain_yy"],
+    aliases=("epsilon_yy", "strain_yy"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "yy"},
 )
 
 STRAIN_ZZ = Field(
     name="Strain_zz",
     symbol="ε_zz",
-    unit=ureg.dimensionless,
+    unit=DIMENSIONLESS,
     field_type=FieldType.STRAIN,
     description="Normal strain zz-component",
     latex_symbol=r"$\varepsilon_{zz}$",
-    aliases=["epsilon_zz", "strain_zz"],
+    aliases=("epsilon_zz", "strain_zz"),
     metadata={"category": "mechanical", "type": "tensor_component", "component": "zz"},
 )
 
@@ -210,41 +224,18 @@ DISPLACEMENT = Field(
     field_type=FieldType.LENGTH,
     description="Displacement magnitude",
     latex_symbol=r"$u$",
-    aliases=["u", "displacement", "disp"],
+    aliases=("u", "displacement", "disp"),
     metadata={"category": "mechanical", "type": "vector_magnitude"},
 )
 
-DISPLACEMENT_X = Field(
-    name="Displacement_x",
-    symbol="u_x",
-    unit=ureg.meter,
-    field_type=FieldType.LENGTH,
-    description="Displacement x-component",
-    latex_symbol=r"$u_x$",
-    aliases=["ux", "u_x", "displacement_x"],
-    metadata={"category": "mechanical", "type": "component", "component": "x"},
-)
-
-DISPLACEMENT_Y = Field(
-    name="Displacement_y",
-    symbol="u_y",
-    unit=ureg.meter,
-    field_type=FieldType.LENGTH,
-    description="Displacement y-component",
-    latex_symbol=r"$u_y$",
-    aliases=["uy", "u_y", "displacement_y"],
-    metadata={"category": "mechanical", "type": "component", "component": "y"},
-)
-
-DISPLACEMENT_Z = Field(
-    name="Displacement_z",
-    symbol="u_z",
+DISPLACEMENT_X, DISPLACEMENT_Y, DISPLACEMENT_Z = vector_components(
+    name="Displacement",
+    symbol="u",
     unit=ureg.meter,
     field_type=FieldType.LENGTH,
-    description="Displacement z-component",
-    latex_symbol=r"$u_z$",
-    aliases=["uz", "u_z", "displacement_z"],
-    metadata={"category": "mechanical", "type": "component", "component": "z"},
+    description="Displacement",
+    category="mechanical",
+    alias="displacement",
 )
 
 
@@ -255,23 +246,23 @@ DISPLACEMENT_Z = Field(
 YOUNG_MODULUS = Field(
     name="YoungModulus",
     symbol="E",
-    unit=ureg.pascal,
+    unit=PA,
     field_type=FieldType.YOUNG_MODULUS,
     description="Young's modulus (elastic modulus)",
     latex_symbol=r"$E$",
-    aliases=["E_modulus", "young_modulus", "elastic_modulus"],
+    aliases=("E_modulus", "young_modulus", "elastic_modulus"),
     metadata={"category": "mechanical", "type": "material_property"},
 )
 
 POISSON_RATIO = Field(
     name="PoissonRatio",
     symbol="ν",
-    unit=ureg.dimensionless,
+    unit=DIMENSIONLESS,
     field_type=FieldType.POISSON_RATIO,
     description="Poisson's ratio",
     latex_symbol=r"$\nu$",
     # FIXED: Changed "nu" to "nu_poisson" to avoid conflict with KinematicViscosity
-    aliases=["nu_poisson", "poisson_ratio", "poisson"],
+    aliases=("nu_poisson", "poisson_ratio", "poisson"),
     metadata={"category": "mechanical", "type": "material_property"},
 )
 
@@ -286,15 +277,15 @@ POISSON_RATIO = Field(
 # =============================================================================
 
 # Force and components
-FORCE_FIELDS: List[Field] = [
+FORCE_FIELDS: Tuple[Field, ...] = (
     FORCE,
     FORCE_X,
     FORCE_Y,
     FORCE_Z,
-]
+)
 
 # Stress (scalar and tensor components)
-STRESS_FIELDS: List[Field] = [
+STRESS_FIELDS: Tuple[Field, ...] = (
     STRESS,
     STRESS_XX,
     STRESS_YY,
@@ -302,37 +293,37 @@ STRESS_FIELDS: List[Field] = [
     STRESS_XY,
     STRESS_XZ,
     STRESS_YZ,
-]
+)
 
 # Strain (scalar and tensor components)
-STRAIN_FIELDS: List[Field] = [
+STRAIN_FIELDS: Tuple[Field, ...] = (
     STRAIN,
     STRAIN_XX,
     STRAIN_YY,
     STRAIN_ZZ,
-]
+)
 
 # Displacement and components
-DISPLACEMENT_FIELDS: List[Field] = [
+DISPLACEMENT_FIELDS: Tuple[Field, ...] = (
     DISPLACEMENT,
     DISPLACEMENT_X,
     DISPLACEMENT_Y,
     DISPLACEMENT_Z,
-]
+)
 
 # Material properties (DENSITY removed - use hydraulics.DENSITY)
-MECHANICAL_MATERIAL_PROPERTIES: List[Field] = [
+MECHANICAL_MATERIAL_PROPERTIES: Tuple[Field, ...] = (
     YOUNG_MODULUS,
     POISSON_RATIO,
-]
+)
 
 # All mechanical fields
-MECHANICAL_FIELDS: List[Field] = (
-    FORCE_FIELDS
-    + STRESS_FIELDS
-    + STRAIN_FIELDS
-    + DISPLACEMENT_FIELDS
-    + MECHANICAL_MATERIAL_PROPERTIES
+MECHANICAL_FIELDS: Tuple[Field, ...] = (
+    *FORCE_FIELDS,
+    *STRESS_FIELDS,
+    *STRAIN_FIELDS,
+    *DISPLACEMENT_FIELDS,
+    *MECHANICAL_MATERIAL_PROPERTIES,
 )
 
 
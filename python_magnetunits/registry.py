@@ -4,9 +4,10 @@ Field registry for centralized field management and lookup.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
-from .field import Field
+from .field import Field, _dimension_signature, _resolve_unit
 
 
 class FieldRegistry:
@@ -38,7 +39,19 @@ class FieldRegistry:
         """Initialize an empty field registry."""
         self._fields: Dict[str, Field] = {}
         self._by_symbol: Dict[str, Field] = {}
-        self._by_alias: Dict[str, List[Field]] = {}
+        # alias / metadata["category"] -> {field name: Field}; keyed by name so
+        # removal is O(1) while keeping registration order
+        self._by_alias: Dict[str, Dict[str, Field]] = {}
+        self._by_category: Dict[str, Dict[str, Field]] = {}
+        self._by_exclude_region: Dict[str, Dict[str, Field]] = {}
+        # Field name -> category it was indexed under. Metadata is mutable, so
+        # unlinking must not re-read it to find the field's category bucket
+        self._indexed_category: Dict[str, Any] = {}
+        # Resolved identifier -> Field lookup table (name, symbol and unambiguous
+        # aliases), kept in sync with the tables above so get() is a single probe
+        self._index: Dict[str, Field] = {}
+        # Cached summary() text, reset whenever the registry changes
+        self._summary: Optional[str] = None
 
     def register(self, field: Field) -> None:
         """
@@ -55,12 +68,85 @@ class FieldRegistry:
             >>> field = Field(name="Temperature", symbol="T", unit="kelvin")
             >>> registry.register(field)
         """
+        self._summary = None
+        stale: List[str] = []
+        previous = self._fields.get(field.name)
+        if previous is not None:
+            self._unlink(previous)
+            stale = self._keys(previous)
+
         self._fields[field.name] = field
         self._by_symbol[field.symbol] = field
         for alias in field.aliases:
-            if alias not in self._by_alias:
-                self._by_alias[alias] = []
-            self._by_alias[alias].append(field)
+            self._by_alias.setdefault(alias, {})[field.name] = field
+        category = self._category(field)
+        if category:
+            self._by_category.setdefault(category, {})[field.name] = field
+            self._indexed_category[field.name] = category
+        for region in field.exclude_regions_set:
+            self._by_exclude_region.setdefault(region, {})[field.name] = field
+
+        self._reindex(stale + self._keys(field))
+
+    @staticmethod
+    def _keys(field: Field) -> List[str]:
+        """Return every identifier (name, symbol, aliases) a field is indexed under."""
+        return [field.name, field.symbol, *field.aliases]
+
+    @staticmethod
+    def _category(field: Field) -> Any:
+        """Return the field's metadata category, interned when it is a string."""
+        category = field.metadata.get("category")
+        return sys.intern(category) if isinstance(category, str) else category
+
+    def _resolve(self, identifier: str) -> Optional[Field]:
+        """
+        Resolve an identifier against the name, symbol and alias tables.
+
+        The lookup is performed in order of priority: name, symbol, then alias
+        (only if unambiguous).
+        """
+        field = self._fields.get(identifier)
+        if field is not None:
+            return field
+        field = self._by_symbol.get(identifier)
+        if field is not None:
+            return field
+        matches = self._by_alias.get(identifier)
+        if matches is not None and len(matches) == 1:
+            return next(iter(matches.values()))
+        return None
+
+    def _reindex(self, identifiers: Iterable[str]) -> None:
+        """Refresh the resolved lookup table for the given identifiers."""
+        for identifier in identifiers:
+            field = self._resolve(identifier)
+            if field is None:
+                self._index.pop(identifier, None)
+            else:
+                self._index[identifier] = field
+
+    def _unlink(self, field: Field) -> None:
+        """Remove a field from the name, symbol and alias tables (not the index)."""
+        del self._fields[field.name]
+
+        if self._by_symbol.get(field.symbol) is field:
+            del self._by_symbol[field.symbol]
+
+        for alias in field.aliases:
+            self._discard(self._by_alias, alias, field.name)
+        self._discard(self._by_category, self._indexed_category.pop(field.name, None), field.name)
+        for region in field.exclude_regions_set:
+            self._discard(self._by_exclude_region, region, field.name)
+
+    @staticmethod
+    def _discard(table: Dict[str, Dict[str, Field]], key: Optional[str], name: str) -> None:
+        """Remove name from table[key], dropping the bucket once it is empty."""
+        bucket = table.get(key) if key else None
+        if bucket is not None:
+            bucket.pop(name, None)
+            if not bucket:
+                del table[key]
 
     def get(self, identifier: str) -> Optional[Field]:
         """
@@ -86,50 +172,91 @@ class FieldRegistry:
             >>> registry.get("B")  # Also returns the Field
             >>> registry.get("NonExistent")  # Returns None
         """
-        # Try direct name lookup (highest priority)
-        if identifier in self._fields:
-            return self._fields[identifier]
+        return self._index.get(identifier)
+
+    def iter_fields(
+        self,
+        category: Optional[str] = None,
+        predicate: Optional[Callable[[Field], bool]] = None,
+        excludes_region: Optional[str] = None,
+    ) -> Iterator[Field]:
+        """
+        Iterate over registered fields, optionally filtered.
 
-        # Try symbol lookup
-        if identifier in self._by_symbol:
-            return self._by_symbol[identifier]
+        Unlike list_fields(), no list is built, so looking for the first match
+        stops as soon as it is found. The registry must not be modified while
+        the iterator is in use.
 
-        # Try alias lookup (may be ambiguous)
-        if identifier in self._by_alias:
-            matches = self._by_alias[identifier]
-            if len(matches) == 1:
-                return matches[0]
-            # Multiple matches - ambiguous, return None
-            # Caller can handle or raise error if needed
+        Categories are indexed when a field is registered, so changing a
+        field's ``metadata["category"]`` afterwards requires registering it
+        again (register() or bulk_register()).
 
-        return None
+        Args:
+            category: Optional metadata category to filter by
+            predicate: Optional function returning True for fields to keep
+            excludes_region: Optional region; keep only fields excluded from it
+
+        Returns:
+            Iterator over matching Field objects, in registration order
 
-    def list_fields(self, category: Optional[str] = None) -> List[Field]:
+        Example:
+            >>> registry = FieldRegistry()
+            >>> # ... register fields ...
+            >>> first_tesla = next(
+            ...     registry.iter_fields(predicate=lambda f: str(f.unit) == "tesla"), None
+            ... )
         """
-        List all registered fields, optionally filtered by category.
+        fields: Iterable[Field]
+        if excludes_region:
+            fields = self._by_exclude_region.get(excludes_region, {}).values()
+            if category:
+                in_category = self._by_category.get(category, {})
+                fields = (field for field in fields if field.name in in_category)
+        elif category:
+            fields = self._by_category.get(category, {}).values()
+        else:
+            fields = self._fields.values()
+        if predicate is None:
+            return iter(fields)
+        return (field for field in fields if predicate(field))
+
+    def list_fields(
+        self,
+        category: Optional[str] = None,
+        predicate: Optional[Callable[[Field], bool]] = None,
+        excludes_region: Optional[str] = None,
+    ) -> List[Field]:
+        """
+        List all registered fields, optionally filtered.
 
         Args:
             category: Optional metadata category to filter by
+            predicate: Optional function returning True for fields to keep
+            excludes_region: Optional region; keep only fields excluded from it
 
         Returns:
-            List of Field objects, optionally filtered by category
+            List of Field objects, optionally filtered
 
         Example:
             >>> registry = FieldRegistry()
             >>> # ... register fields ...
             >>> em_fields = registry.list_fields(category="electromagnetic")
+            >>> air_excluded = registry.list_fields(excludes_region="Air")
         """
-        fields = list(self._fields.values())
-        if category:
-            fields = [f for f in fields if f.metadata.get("category") == category]
-        return fields
+        return list(self.iter_fields(category, predicate, excludes_region))
 
-    def bulk_register(self, fields: List[Field]) -> None:
+    def bulk_register(self, fields: Iterable[Field]) -> None:
         """
         Register multiple fields at once.
 
+        Equivalent to calling register() for each field in order. When none of
+        the names are already registered (or repeated within the batch), the
+        tables are filled in one pass and each identifier is resolved once. A
+        batch whose fields are all already registered (as the same objects,
+        still owning their symbols and categories) returns immediately.
+
         Args:
-            fields: List of Field objects to register
+            fields: Field objects to register (any iterable, e.g. a list or tuple)
 
         Example:
             >>> registry = FieldRegistry()
@@ -139,8 +266,42 @@ class FieldRegistry:
             ... ]
             >>> registry.bulk_register(fields)
         """
+        fields = list(fields)
+        registered = self._fields
+        by_symbol = self._by_symbol
+        indexed_category = self._indexed_category
+        if all(
+            registered.get(field.name) is field
+            and by_symbol.get(field.symbol) is field
+            and indexed_category.get(field.name) == (self._category(field) or None)
+            for field in fields
+        ):
+            # Re-registering the same objects (e.g. calling a register_*_fields()
+            # helper twice) would leave every table unchanged, unless a field's
+            # category was changed since it was indexed
+            return
+
+        names = {field.name for field in fields}
+        if len(names) != len(fields) or not names.isdisjoint(self._fields):
+            # Replacements need the per-field unlink logic
+            for field in fields:
+                self.register(field)
+            return
+
+        self._summary = None
+        self._fields.update((field.name, field) for field in fields)
+        self._by_symbol.update((field.symbol, field) for field in fields)
         for field in fields:
-            self.register(field)
+            for alias in field.aliases:
+                self._by_alias.setdefault(alias, {})[field.name] = field
+            category = self._category(field)
+            if category:
+                self._by_category.setdefault(category, {})[field.name] = field
+                self._indexed_category[field.name] = category
+            for region in field.exclude_regions_set:
+                self._by_exclude_region.setdefault(region, {})[field.name] = field
+
+        self._reindex(dict.fromkeys(key for field in fields for key in self._keys(field)))
 
     def has_field(self, identifier: str) -> bool:
         """
@@ -152,7 +313,7 @@ class FieldRegistry:
         Returns:
             True if field exists, False otherwise
         """
-        return self.get(identifier) is not None
+        return identifier in self._index
 
     def remove(self, field_name: str) -> bool:
         """
@@ -166,26 +327,84 @@ class FieldRegistry:
         Returns:
             True if field was removed, False if not found
         """
-        if field_name not in self._fields:
+        field = self._fields.get(field_name)
+        if field is None:
             return False
 
-        field = self._fields[field_name]
-        del self._fields[field_name]
+        self._summary = None
+        self._unlink(field)
+        self._reindex(self._keys(field))
+        return True
 
-        # Remove symbol mapping
-        if field.symbol in self._by_symbol:
-            del self._by_symbol[field.symbol]
+    def summary(self) -> str:
+        """
+        Get a human-readable summary of the registry.
 
-        # Remove alias mappings
-        for alias in field.aliases:
-            if alias in self._by_alias:
-                self._by_alias[alias] = [
-                    f for f in self._by_alias[alias] if f.name != field_name
-                ]
-                if not self._by_alias[alias]:
-                    del self._by_alias[alias]
+        The text is built once and reused until the registry is modified.
 
-        return True
+        Returns:
+            Multi-line string with the number of fields and fields per category
+
+        Example:
+            >>> registry = FieldRegistry()
+            >>> registry.register(
+            ...     Field(
+            ...         name="B", symbol="B", unit="tesla", metadata={"category": "electromagnetic"}
+            ...     )
+            ... )
+            >>> print(registry.summary())
+            FieldRegistry Summary:
+              Total fields: 1
+              Categories: 1
+              Fields by category:
+                electromagnetic: 1
+        """
+        if self._summary is None:
+            lines = [
+                "FieldRegistry Summary:",
+                f"  Total fields: {len(self._fields)}",
+                f"  Categories: {len(self._by_category)}",
+            ]
+            if self._by_category:
+                lines.append("  Fields by category:")
+                for category, fields in sorted(self._by_category.items()):
+                    lines.append(f"    {category}: {len(fields)}")
+            self._summary = "\n".join(lines)
+        return self._summary
+
+    def warm_conversions(self, units: Iterable[Union[str, Any]]) -> int:
+        """
+        Precompute conversions from every registered field to the given units.
+
+        For each field, the scale factor and offset to each dimensionally
+        compatible unit are computed now and stored in the field's conversion
+        cache, so later ``convert`` calls to those units (given the same way,
+        string or Unit) never reach pint. Incompatible units are skipped, so one
+        list of display units can cover every physical quantity. Fields
+        registered afterwards are not warmed.
+
+        Args:
+            units: Target units (strings or pint Units), e.g. preferred display units
+
+        Returns:
+            Number of (field, unit) conversions cached
+
+        Example:
+            >>> registry = FieldRegistry()
+            >>> registry.register(Field(name="B", symbol="B", unit="tesla"))
+            >>> registry.register(Field(name="T", symbol="T", unit="kelvin"))
+            >>> registry.warm_conversions(["millitesla", "Gauss", "degC", "bar"])
+            3
+        """
+        targets = [(unit, _dimension_signature(_resolve_unit(unit))) for unit in units]
+        count = 0
+        for field in self._fields.values():
+            signature = _dimension_signature(field.unit)
+            for unit, target_signature in targets:
+                if target_signature == signature:
+                    field.prime_conversion(unit)
+                    count += 1
+        return count
 
     def __len__(self) -> int:
         """Return the number of registered fields."""
@@ -193,7 +412,7 @@ class FieldRegistry:
 
     def __contains__(self, identifier: str) -> bool:
         """Support 'in' operator for checking field existence."""
-        return self.has_field(identifier)
+        return identifier in self._index
 
     def __repr__(self) -> str:
         """String representation of the registry."""
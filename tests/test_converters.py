@@ -2,8 +2,10 @@
 Tests for the converters module.
 """
 
+import numpy as np
 import pytest
 from python_magnetunits import (
+    compile_field_units,
     convert_array,
     convert_data,
     convert_value,
@@ -36,6 +38,33 @@ class TestConvertValue:
         with pytest.raises(Exception):  # pint.DimensionalityError
             convert_value(1.0, "tesla", "meter")
 
+    def test_convert_value_caches_factor(self) -> None:
+        """Test that repeated conversions of a unit pair give consistent results."""
+        assert convert_value(1.0, "tesla", "microtesla") == pytest.approx(1e6)
+        assert convert_value(2.0, ureg.tesla, "microtesla") == pytest.approx(2e6)
+        assert convert_value(3.0, "tesla", ureg.microtesla) == pytest.approx(3e6)
+
+    def test_convert_value_sequences(self) -> None:
+        """Test that lists, tuples and arrays are converted element-wise."""
+        for values in ([1, 2], (1.0, 2.0), np.array([1.0, 2.0])):
+            result = convert_value(values, "tesla", "millitesla")
+            assert isinstance(result, np.ndarray)
+            np.testing.assert_allclose(result, [1000.0, 2000.0])
+        np.testing.assert_allclose(convert_value([0.0, 100.0], "degC", "kelvin"), [273.15, 373.15])
+
+    def test_convert_value_same_unit(self) -> None:
+        """Test that converting to the same unit returns the value as a float."""
+        assert convert_value(25, "degC", "degC") == 25.0
+        assert isinstance(convert_value(3, "tesla", ureg.Unit("tesla")), float)
+
+    def test_convert_value_same_unit_sequences(self) -> None:
+        """Test that sequences converted to the same unit come back as float arrays."""
+        for values in ([1, 2], (1, 2), np.array([1, 2])):
+            result = convert_value(values, "tesla", "tesla")
+            assert isinstance(result, np.ndarray)
+            assert result.dtype == np.float64
+            np.testing.assert_array_equal(result, [1.0, 2.0])
+
 
 class TestConvertArray:
     """Test array value conversion."""
@@ -59,6 +88,33 @@ class TestConvertArray:
         expected = [50.0, 150.0, 250.0]
         assert all(abs(r - e) < 0.01 for r, e in zip(result, expected))
 
+    def test_convert_array_returns_list_for_list_input(self) -> None:
+        """Test that list input gives a list of Python floats."""
+        result = convert_array([1.0, 2.0], "meter", "centimeter")
+        assert isinstance(result, list)
+        assert result == pytest.approx([100.0, 200.0])
+
+    def test_convert_array_numpy_input(self) -> None:
+        """Test that NumPy input gives a NumPy array of the same shape."""
+        values = np.array([[1.0, 2.0], [3.0, 4.0]])
+        result = convert_array(values, "tesla", ureg.millitesla)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (2, 2)
+        assert np.allclose(result, values * 1000.0)
+
+    def test_convert_array_temperature(self) -> None:
+        """Test vectorized conversion of offset temperature units."""
+        result = convert_array([273.15, 373.15], "kelvin", "degC")
+        assert result == pytest.approx([0.0, 100.0])
+
+    def test_convert_array_same_unit_copies(self) -> None:
+        """Test that a same-unit conversion returns a copy of the input."""
+        values = np.array([1.0, 2.0])
+        result = convert_array(values, "tesla", "tesla")
+        np.testing.assert_array_equal(result, values)
+        assert result is not values
+        assert convert_array([1, 2], "degC", "degC") == [1.0, 2.0]
+
 
 class TestConvertData:
     """Test the magnetrun-compatible convert_data function."""
@@ -103,6 +159,80 @@ class TestConvertData:
         result = convert_data(field_units, 1.0, "B")
         assert abs(result - 1000.0) < 0.1
 
+    def test_convert_data_temperature_list(self) -> None:
+        """Test converting a list of temperatures with dict format."""
+        field_units = {"Temperature": [ureg.degC, ureg.kelvin]}
+        result = convert_data(field_units, [0.0, 100.0], "Temperature")
+        assert result == pytest.approx([273.15, 373.15])
+
+    def test_convert_data_scalar_and_array_types(self) -> None:
+        """Test that scalars stay scalars and NumPy arrays stay arrays."""
+        field_units = {"B": [ureg.tesla, ureg.millitesla]}
+        scalar = convert_data(field_units, 2.0, "B")
+        assert isinstance(scalar, float)
+        assert scalar == pytest.approx(2000.0)
+        array = convert_data(field_units, np.array([1.0, 2.0]), "B")
+        assert isinstance(array, np.ndarray)
+        assert np.allclose(array, [1000.0, 2000.0])
+
+    def test_convert_data_tuple(self) -> None:
+        """Test that tuples are converted like other sequences."""
+        assert np.allclose(
+            convert_data({"B": ["tesla", "millitesla"]}, (1.0, 2.0), "B"), [1000.0, 2000.0]
+        )
+        assert np.allclose(
+            convert_data({"Temperature": ["degC", "kelvin"]}, (0.0, 100.0), "Temperature"),
+            [273.15, 373.15],
+        )
+
+    def test_convert_data_fahrenheit(self) -> None:
+        """Test offset conversion between two non-kelvin temperature scales."""
+        field_units = {"Temperature": ["degF", "degC"]}
+        assert convert_data(field_units, [32.0, 212.0], "Temperature") == pytest.approx(
+            [0.0, 100.0]
+        )
+        assert convert_data(field_units, 212.0, "Temperature") == pytest.approx(100.0)
+
+    def test_convert_data_incompatible_units_raises_error(self) -> None:
+        """Test that incompatible units still raise in the cached path."""
+        field_units = {"B": [ureg.tesla, ureg.meter]}
+        with pytest.raises(Exception):  # pint.DimensionalityError
+            convert_data(field_units, [1.0], "B")
+
+
+class TestCompileFieldUnits:
+    """Test precompiled per-field converters."""
+
+    def test_compiled_matches_convert_data(self) -> None:
+        """Test that compiled converters agree with convert_data."""
+        field_units = {
+            "MagneticField": [ureg.tesla, ureg.millitesla],
+            "Temperature": ["degC", "kelvin"],
+        }
+        converters = compile_field_units(field_units)
+        assert set(converters) == set(field_units)
+        for fieldname, values in [("MagneticField", [1.0, 2.5]), ("Temperature", [0.0, 25.0])]:
+            assert converters[fieldname](values) == pytest.approx(
+                convert_data(field_units, values, fieldname)
+            )
+            assert converters[fieldname](values[1]) == pytest.approx(
+                convert_data(field_units, values[1], fieldname)
+            )
+
+    def test_compiled_value_types(self) -> None:
+        """Test that lists give lists and NumPy arrays give arrays."""
+        convert = compile_field_units({"B": ["tesla", "millitesla"]})["B"]
+        assert isinstance(convert([1.0]), list)
+        assert isinstance(convert(np.array([1.0])), np.ndarray)
+        assert np.allclose(convert((1.0, 2.0)), [1000.0, 2000.0])
+        to_kelvin = compile_field_units({"T": ["degC", "kelvin"]})["T"]
+        assert np.allclose(to_kelvin((0.0, 100.0)), [273.15, 373.15])
+
+    def test_compile_incompatible_units_raises_error(self) -> None:
+        """Test that incompatible units are reported at compile time."""
+        with pytest.raises(Exception):  # pint.DimensionalityError
+            compile_field_units({"B": ["tesla", "meter"]})
+
 
 class TestGetUnitString:
     """Test unit string formatting."""
@@ -130,6 +260,12 @@ class TestGetUnitString:
         result = get_unit_string(ureg.tesla, pretty=True)
         assert "tesla" in result or "T" in result
 
+    def test_get_unit_string_is_cached(self) -> None:
+        """Test that formatting the same unit twice reuses the cached string."""
+        unit = ureg.watt / ureg.meter / ureg.kelvin
+        assert get_unit_string(unit) is get_unit_string(ureg.watt / ureg.meter / ureg.kelvin)
+        assert get_unit_string(unit, pretty=False) != get_unit_string(unit, pretty=True)
+
 
 class TestAreCompatible:
     """Test unit compatibility checking."""
@@ -2,8 +2,17 @@
 Tests for the Field class.
 """
 
+import dataclasses
+import pickle
+import subprocess
+import sys
+from typing import Any
+
+import numpy as np
+import pint
 import pytest
 from python_magnetunits import Field, ureg
+from python_magnetunits import field as field_module
 
 
 class TestFieldCreation:
@@ -48,6 +57,12 @@ class TestFieldCreation:
         assert "B_field" in field.aliases
         assert "magnetic_field" in field.aliases
 
+    def test_aliases_stored_as_tuple(self) -> None:
+        """Test that aliases given as a list are stored as a tuple."""
+        field = Field(name="B", symbol="B", unit="tesla", aliases=["B_field", "Bfield"])
+        assert field.aliases == ("B_field", "Bfield")
+        assert Field(name="E", symbol="E", unit="volt/meter").aliases == ()
+
     def test_field_with_excluded_regions(self) -> None:
         """Test field with excluded regions."""
         field = Field(
@@ -58,6 +73,23 @@ class TestFieldCreation:
         )
         assert "vacuum" in field.exclude_regions
         assert "space" in field.exclude_regions
+        assert field.exclude_regions_set == frozenset({"vacuum", "space"})
+        assert field.exclude_regions == ("vacuum", "space")
+
+    def test_field_is_frozen(self) -> None:
+        """Test that fields cannot be modified after creation."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            field.unit = ureg.gauss  # type: ignore[misc]
+
+    def test_field_hashable(self) -> None:
+        """Test that equal fields hash equally and can be used as dict keys."""
+        first = Field(name="B", symbol="B", unit="tesla", metadata={"category": "em"})
+        second = Field(name="B", symbol="B", unit=ureg.tesla, metadata={"category": "em"})
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first: 1}[second] == 1
+        assert len({first, second, Field(name="H", symbol="H", unit="A/m")}) == 2
 
     def test_field_with_metadata(self) -> None:
         """Test field with custom metadata."""
@@ -70,6 +102,92 @@ class TestFieldCreation:
         assert field.metadata["category"] == "electromagnetic"
         assert field.metadata["component"] == "scalar"
 
+    def test_fields_share_interned_unit(self) -> None:
+        """Test that fields with the same unit share one Unit object."""
+        field1 = Field(name="B1", symbol="B1", unit="tesla")
+        field2 = Field(name="B2", symbol="B2", unit=ureg.tesla)
+        assert field1.unit is field2.unit
+
+    def test_compound_units_share_interned_unit(self) -> None:
+        """Test that compound units built separately resolve to one Unit object."""
+        field1 = Field(name="E1", symbol="E1", unit=ureg.volt / ureg.meter)
+        field2 = Field(name="E2", symbol="E2", unit=ureg.volt / ureg.meter)
+        field3 = Field(name="E3", symbol="E3", unit="V/m")
+        assert field1.unit is field2.unit is field3.unit
+
+    def test_unit_from_other_registry_kept(self) -> None:
+        """Test that a Unit from another registry is not swapped for a package Unit."""
+        Field(name="B1", symbol="B1", unit="tesla")
+        other_tesla = pint.UnitRegistry().tesla
+        field = Field(name="B2", symbol="B2", unit=other_tesla)
+        assert field.unit is other_tesla
+
+    def test_pickle_restores_into_global_registry(self) -> None:
+        """Test that pickled fields unpickle with units from the package registry."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        restored = pickle.loads(pickle.dumps(field))
+        assert restored == field
+        assert restored.convert(1.0, "millitesla") == pytest.approx(1000.0)
+        assert restored.unit == ureg.tesla
+
+    def test_pickle_keeps_all_arguments(self) -> None:
+        """Test that compound and offset units and metadata survive pickling."""
+        for field in (
+            Field(name="E", symbol="E", unit="V/m", aliases=("E_field",)),
+            Field(name="T", symbol="T", unit="degC", metadata={"category": "thermal"}),
+        ):
+            restored = pickle.loads(pickle.dumps(field))
+            assert restored == field
+            assert restored.unit is field.unit
+            assert restored.aliases == field.aliases
+            assert restored.metadata == field.metadata
+
+    def test_import_leaves_application_registry_alone(self) -> None:
+        """Test that importing the package does not replace pint's application registry."""
+        code = (
+            "import pickle, pint; pint.get_application_registry().Quantity(1, 'meter'); "
+            "default = pint.get_application_registry().get(); "
+            "from python_magnetunits import Field, ureg; "
+            "assert pint.get_application_registry().get() is default; "
+            "restored = pickle.loads(pickle.dumps(Field(name='B', symbol='B', unit='tesla'))); "
+            "assert restored.unit == ureg.tesla"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_user_application_registry_survives_import(self) -> None:
+        """Test that importing the package keeps an application registry set by the user."""
+        code = (
+            "import pint; user = pint.UnitRegistry(); user.define('smoot = 1.7018 meter'); "
+            "pint.set_application_registry(user); import python_magnetunits; "
+            "assert pint.get_application_registry().get() is user; "
+            "pint.get_application_registry().Quantity(1, 'smoot')"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_identifier_strings_interned(self) -> None:
+        """Test that name and string metadata values are interned."""
+        # Build the strings at runtime so they are not compile-time constants
+        name = "".join(["Magnetic", "Field"])
+        category = "".join(["electro", "magnetic"])
+        field = Field(name=name, symbol="B", unit="tesla", metadata={"category": category})
+        assert field.name is sys.intern("MagneticField")
+        assert field.metadata["category"] is sys.intern("electromagnetic")
+
+    def test_metadata_dict_not_mutated(self) -> None:
+        """Test that the caller's metadata dict is copied, not modified."""
+        category = "".join(["electro", "magnetic"])
+        metadata = {"category": category}
+        field = Field(name="B", symbol="B", unit="tesla", metadata=metadata)
+        assert metadata["category"] is category
+        field.metadata["component"] = "x"
+        assert "component" not in metadata
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_field_uses_slots(self) -> None:
+        """Test that Field instances carry no per-instance __dict__."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        assert not hasattr(field, "__dict__")
+
 
 class TestFieldConversion:
     """Test unit conversion functionality."""
@@ -94,6 +212,135 @@ class TestFieldConversion:
         expected = [1000.0, 2000.0, 3000.0]
         assert all(abs(r - e) < 0.1 for r, e in zip(result, expected))
 
+    def test_convert_array_returns_ndarray(self) -> None:
+        """Test that convert_array returns a NumPy array by default."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        result = field.convert_array(np.array([1.0, 2.0]), "millitesla")
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, [1000.0, 2000.0])
+
+    def test_convert_array_return_list(self) -> None:
+        """Test that convert_array can return a plain list."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        result = field.convert_array([1.0, 2.0], "millitesla", return_list=True)
+        assert isinstance(result, list)
+        assert result == pytest.approx([1000.0, 2000.0])
+
+    def test_convert_array_temperature(self) -> None:
+        """Test converting an array of offset (temperature) units."""
+        field = Field(name="T", symbol="T", unit="kelvin")
+        result = field.convert_array([273.15, 373.15], "degC")
+        np.testing.assert_allclose(result, [0.0, 100.0], atol=1e-9)
+
+    def test_convert_array_same_unit_copies(self) -> None:
+        """Test that converting an array to the field's own unit copies it."""
+        field = Field(name="T", symbol="T", unit="degC")
+        values = np.array([20.0, 25.0])
+        result = field.convert_array(values, "degC")
+        np.testing.assert_array_equal(result, values)
+        assert result is not values
+
+    def test_convert_array_large_temperature(self) -> None:
+        """Test that large offset-scale conversions match pint."""
+        field = Field(name="T", symbol="T", unit="kelvin")
+        values = np.linspace(0.0, 2000.0, 5000)
+        expected = ureg.Quantity(values, "kelvin").to("degF").magnitude
+        np.testing.assert_allclose(field.convert_array(values, "degF"), expected, atol=1e-9)
+
+    def test_convert_to_same_unit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that converting to the field's own unit is a no-op."""
+        field = Field(name="T", symbol="T", unit="degC")
+
+        # No conversion coefficients are computed for the field's own unit
+        def fail(*args: Any) -> None:
+            raise AssertionError("coefficients computed for the same unit")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(field_module, "_affine_coefficients", fail)
+            assert field.convert(25, "degC") == 25.0
+            assert field.convert(25, field.unit) == 25.0
+        # An equal but distinct Unit object gives the same result
+        assert field.convert(25, ureg.degC) == 25.0
+
+    def test_convert_to_same_unit_keeps_value_type(self) -> None:
+        """Test that the same unit given by name or as a Unit returns the value as is."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        for unit in ("tesla", ureg.tesla, ureg.Unit("tesla")):
+            result = field.convert(2, unit)
+            assert result == 2
+            assert type(result) is int
+
+    def test_prime_conversion(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a primed conversion is served without recomputing coefficients."""
+        field = Field(name="T", symbol="T", unit="kelvin")
+        field.prime_conversion("degC")
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("conversion was not primed")
+
+        monkeypatch.setattr(field_module, "_affine_coefficients", fail)
+        assert field.convert(300.0, "degC") == pytest.approx(26.85)
+
+    def test_prime_incompatible_unit_raises_error(self) -> None:
+        """Test that priming an incompatible unit raises like convert()."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        with pytest.raises(pint.DimensionalityError):
+            field.prime_conversion("meter")
+
+    def test_convert_array_value_to_same_unit(self) -> None:
+        """Test that an array converted to the field's own unit is returned as an array."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        values = np.array([1.0, 2.0])
+        np.testing.assert_array_equal(field.convert(values, "tesla"), values)
+        np.testing.assert_array_equal(field.convert(values, field.unit), values)
+
+    def test_convert_sequences(self) -> None:
+        """Test converting lists, tuples and arrays on the same-unit and factor paths."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        for values in ([1.0, 2.0], (1.0, 2.0), np.array([1.0, 2.0])):
+            np.testing.assert_allclose(field.convert(values, "millitesla"), [1000.0, 2000.0])
+            as_list = field.convert_array(values, "millitesla", return_list=True)
+            assert isinstance(as_list, list)
+            assert as_list == pytest.approx([1000.0, 2000.0])
+            np.testing.assert_allclose(field.convert(values, "tesla"), [1.0, 2.0])
+            assert isinstance(field.convert(values, "millitesla"), np.ndarray)
+
+        temperature = Field(name="T", symbol="T", unit="kelvin")
+        np.testing.assert_allclose(temperature.convert([273.15, 373.15], "degC"), [0.0, 100.0])
+
+    def test_offset_applied_only_to_temperature(self) -> None:
+        """Test that only temperature conversions add an offset."""
+        assert Field(name="T", symbol="T", unit="kelvin").convert(0.0, "degC") == pytest.approx(
+            -273.15
+        )
+        assert Field(name="B", symbol="B", unit="tesla").convert(0.0, "millitesla") == 0.0
+
+    def test_convert_caches_factor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeated conversions to a unit reuse the first result."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        assert field.convert(2.0, "millitesla") == pytest.approx(2000.0)
+        assert field.convert(3.0, ureg.millitesla) == pytest.approx(3000.0)
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("conversion was recomputed")
+
+        monkeypatch.setattr(field_module, "_affine_coefficients", fail)
+        assert field.convert(4.0, "millitesla") == pytest.approx(4000.0)
+        assert field.convert(5.0, ureg.millitesla) == pytest.approx(5000.0)
+
+    def test_convert_caches_temperature_offset(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeated offset temperature conversions reuse the first result."""
+        field = Field(name="T", symbol="T", unit="kelvin")
+        assert field.convert(300.0, "degC") == pytest.approx(26.85)
+        assert field.convert(0.0, "degF") == pytest.approx(-459.67)
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("conversion was recomputed")
+
+        monkeypatch.setattr(field_module, "_affine_coefficients", fail)
+        assert field.convert(273.15, "degC") == pytest.approx(0.0)
+        assert field.convert(255.3722222, "degF") == pytest.approx(0.0, abs=1e-5)
+
     def test_convert_temperature(self) -> None:
         """Test converting temperature units."""
         field = Field(name="T", symbol="T", unit="kelvin")
@@ -126,6 +373,31 @@ class TestFieldValidation:
         # Test with a dict which is incompatible
         assert field.validate_value({}) is False
 
+    def test_validate_non_finite_value(self) -> None:
+        """Test that NaN and infinite values are rejected."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        assert field.validate_value(float("nan")) is False
+        assert field.validate_value(float("inf")) is False
+
+    def test_validate_large_int(self) -> None:
+        """Test that integers too large for a float are still valid."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        assert field.validate_value(10**400) is True
+        assert field.validate_value(-(10**400)) is True
+
+    def test_validate_ndarray(self) -> None:
+        """Test validating NumPy arrays by dtype."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        assert field.validate_value(np.array([1.0, 2.0])) is True
+        assert field.validate_value(np.array(["a", "b"])) is False
+
+    def test_validate_numpy_scalar(self) -> None:
+        """Test validating NumPy scalar values."""
+        field = Field(name="B", symbol="B", unit="tesla")
+        assert field.validate_value(np.int64(3)) is True
+        assert field.validate_value(np.float32(1.5)) is True
+        assert field.validate_value(np.float32("nan")) is False
+
     def test_validate_array(self) -> None:
         """Test that validate_value works with individual values."""
         field = Field(name="B", symbol="B", unit="tesla")
@@ -172,6 +444,14 @@ class TestFieldFormatting:
         assert "B" in label
         assert "mT" in label or "millitesla" in label.lower()
 
+    def test_format_label_is_cached(self) -> None:
+        """Test that formatted labels are cached per (unit, use_latex)."""
+        field = Field(name="B", symbol="B", unit="tesla", latex_symbol=r"$B$")
+        first = field.format_label("millitesla", use_latex=True)
+        assert field.format_label("millitesla", use_latex=True) is first
+        assert field.format_label(ureg.millitesla, use_latex=False) == "B [mT]"
+        assert field.format_label(ureg.millitesla, use_latex=True) == first
+
 
 class TestFieldRegionExclusion:
     """Test region/domain exclusion logic."""
@@ -214,3 +494,21 @@ class TestFieldRepresentation:
         assert "Field" in repr_str
         assert "B" in repr_str
         assert "tesla" in repr_str
+
+
+class TestUnitParsingCache:
+    """Test memoized unit string parsing."""
+
+    def test_parsed_unit_matches_registry_unit(self) -> None:
+        """Test that repeated unit strings resolve to the registry's Unit."""
+        first = Field(name="B1", symbol="B1", unit="millitesla")
+        second = Field(name="B2", symbol="B2", unit="millitesla")
+        assert first.unit is second.unit
+        assert first.unit == ureg.millitesla
+
+    def test_pretty_unit_is_shared_across_fields(self) -> None:
+        """Test that fields format the same target unit identically."""
+        first = Field(name="B1", symbol="B1", unit="tesla").format_label("millitesla")
+        second = Field(name="B2", symbol="B2", unit="tesla").format_label(ureg.millitesla)
+        assert first == "B1 [mT]"
+        assert second == "B2 [mT]"
@@ -137,6 +137,18 @@ class TestFieldTypeCompatibility:
         assert FieldType.POISSON_RATIO.is_compatible(ureg.dimensionless) is True
         assert FieldType.RELATIVE_PERMEABILITY.is_compatible(ureg.dimensionless) is True
 
+    def test_unknown_unit_string_is_incompatible(self) -> None:
+        """Test that an unparseable unit string is reported as incompatible."""
+        assert FieldType.MAGNETIC_FIELD.is_compatible("not_a_unit") is False
+
+    def test_string_results_are_remembered(self) -> None:
+        """Test that repeated answers for unit strings stay per field type."""
+        assert FieldType.VELOCITY.is_compatible("km/h") is True
+        assert FieldType.VELOCITY.is_compatible("km/h") is True
+        assert FieldType.PRESSURE.is_compatible("km/h") is False
+        assert FieldType.PRESSURE.is_compatible("bar") is True
+        assert FieldType.VELOCITY.is_compatible("bar") is False
+
 
 class TestFieldTypeCount:
     """Test that all expected field types exist."""
@@ -89,6 +89,16 @@ class TestFieldWithFieldType:
         )
         assert field.field_type == FieldType.STRAIN
 
+    def test_validation_matches_is_compatible(self) -> None:
+        """Test that Field validation agrees with FieldType.is_compatible."""
+        for unit in ("gauss", "millitesla", "degC", "bar", "meter", "percent", "W/m^2"):
+            for field_type in FieldType:
+                if field_type.is_compatible(unit):
+                    Field(name="X", symbol="x", unit=unit, field_type=field_type)
+                else:
+                    with pytest.raises(ValueError):
+                        Field(name="X", symbol="x", unit=unit, field_type=field_type)
+
 
 class TestFieldFromFieldType:
     """Test Field.from_field_type() factory method."""
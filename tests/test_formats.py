@@ -3,14 +3,17 @@ Tests for the formats module.
 """
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 from python_magnetunits import FieldType, ureg
 from python_magnetunits.formats import (
     FieldDefinition,
     FormatDefinition,
+    UNIT_ALIASES,
     FormatMetadata,
     get_field_type,
     normalize_unit,
@@ -42,6 +45,13 @@ class TestNormalizeUnit:
         assert normalize_unit("percent") == "percent"
         assert normalize_unit("%") == "percent"
 
+    def test_alias_added_at_runtime(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that aliases added to UNIT_ALIASES are used by field definitions."""
+        monkeypatch.setitem(UNIT_ALIASES, "mT", "millitesla")
+        assert normalize_unit("mT") == "millitesla"
+        field = FieldDefinition(name="B", field_type="magnetic_field", unit="mT").to_field()
+        assert field.unit == ureg.millitesla
+
 
 class TestGetFieldType:
     """Test FieldType lookup from string."""
@@ -59,6 +69,11 @@ class TestGetFieldType:
         assert get_field_type("unknown_type") is None
         assert get_field_type("") is None
 
+    def test_get_every_field_type_by_value(self) -> None:
+        """Test that every FieldType is found by its string value."""
+        for field_type in FieldType:
+            assert get_field_type(field_type.value) is field_type
+
 
 class TestFieldDefinition:
     """Test FieldDefinition class."""
@@ -90,6 +105,40 @@ class TestFieldDefinition:
         assert defn.field_type == "pressure"
         assert defn.description == "Static pressure"
 
+    def test_from_dict_interns_strings(self) -> None:
+        """Test that identifier strings read from a dict are interned."""
+        data = json.loads('{"name": "T_in1", "field_type": "temperature", "unit": "celsius"}')
+        defn = FieldDefinition.from_dict(data)
+        assert defn.name is sys.intern("T_in1")
+        assert defn.field_type is sys.intern("temperature")
+        assert defn.unit is sys.intern("celsius")
+        assert defn.symbol is None
+
+    def test_from_dict_sequences_are_tuples(self) -> None:
+        """Test that aliases and exclude_regions are stored as tuples."""
+        defn = FieldDefinition.from_dict({"name": "B", "aliases": ["Field", "Bfield"]})
+        assert defn.aliases == ("Field", "Bfield")
+        assert defn.exclude_regions == ()
+        assert defn.to_field().aliases == ("Field", "Bfield")
+
+    def test_from_dict_null_values(self) -> None:
+        """Test that null unit and sequences fall back to their defaults."""
+        data = json.loads('{"name": "B", "unit": null, "aliases": null, "exclude_regions": null}')
+        defn = FieldDefinition.from_dict(data)
+        assert defn.unit == "dimensionless"
+        assert defn.aliases == ()
+        assert defn.exclude_regions == ()
+
+    def test_from_dict_malformed_field_is_skipped(self) -> None:
+        """Test that a malformed field only skips that field when loading a format."""
+        data = {
+            "format_name": "test",
+            "fields": [{"name": "Bad", "unit": 5}, {"name": "B", "unit": "tesla"}],
+        }
+        with pytest.warns(UserWarning, match="Could not create field 'Bad'"):
+            fmt = FormatDefinition.from_dict(data)
+        assert fmt.column_names == ["B"]
+
     def test_to_field_creates_valid_field(self) -> None:
         """Test converting FieldDefinition to Field."""
         defn = FieldDefinition(
@@ -154,6 +203,12 @@ class TestFieldDefinition:
 class TestFormatMetadata:
     """Test FormatMetadata class."""
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_definitions_use_slots(self) -> None:
+        """Test that format dataclasses carry no per-instance __dict__."""
+        assert not hasattr(FormatMetadata(), "__dict__")
+        assert not hasattr(FieldDefinition(name="B"), "__dict__")
+
     def test_default_metadata(self) -> None:
         """Test default metadata values."""
         meta = FormatMetadata()
@@ -193,6 +248,30 @@ class TestFormatDefinition:
         fmt = FormatDefinition("test", field_definitions=field_defs)
         assert len(fmt) == 2
 
+    def test_invalid_and_repeated_columns(self) -> None:
+        """Test that bad definitions are skipped and a repeated column keeps the last one."""
+        field_defs = [
+            FieldDefinition(name="Col1", unit="tesla", symbol="B"),
+            FieldDefinition(name="Bad", unit="not_a_unit"),
+            FieldDefinition(name="Col1", unit="millitesla", symbol="B_mT"),
+        ]
+        with pytest.warns(UserWarning, match="Could not create field 'Bad'"):
+            fmt = FormatDefinition("test", field_definitions=field_defs)
+        assert fmt.column_names == ["Col1"]
+        assert fmt.get_field("Col1").symbol == "B_mT"
+        assert fmt.registry.get("Col1") is fmt.get_field("Col1")
+        assert fmt.registry.get("B") is None
+
+    def test_registry_built_on_first_symbol_lookup(self) -> None:
+        """Test that the FieldRegistry is only built when a symbol lookup needs it."""
+        fmt = FormatDefinition(
+            "test", field_definitions=[FieldDefinition(name="Col1", unit="tesla", symbol="B")]
+        )
+        assert fmt.get_field("Col1") is not None
+        assert fmt._registry is None
+        assert fmt.get_field_by_symbol("B") is fmt.get_field("Col1")
+        assert fmt.registry is fmt.registry
+
     def test_get_field_by_column_name(self) -> None:
         """Test getting field by column name."""
         field_defs = [
@@ -257,6 +336,86 @@ class TestFormatDefinition:
         pressure_fields = fmt.list_fields_by_type(FieldType.PRESSURE)
         assert len(pressure_fields) == 1
 
+        # Returned lists are copies and absent types give an empty list
+        temp_fields.clear()
+        assert len(fmt.list_fields_by_type(FieldType.TEMPERATURE)) == 2
+        assert fmt.list_fields_by_type(FieldType.VELOCITY) == []
+
+    def test_convert_column(self) -> None:
+        """Test converting whole data columns, including offset temperatures."""
+        field_defs = [
+            FieldDefinition(name="Tin", unit="celsius", field_type="temperature"),
+            FieldDefinition(name="Field", unit="tesla", field_type="magnetic_field"),
+        ]
+        fmt = FormatDefinition("test", field_definitions=field_defs)
+
+        values = np.linspace(-50.0, 150.0, 2048)
+        np.testing.assert_allclose(fmt.convert_column("Tin", values, "kelvin"), values + 273.15)
+        np.testing.assert_allclose(fmt.convert_column("Field", [1.0, 1.5], "Gauss"), [1e4, 1.5e4])
+        with pytest.raises(KeyError, match="Missing"):
+            fmt.convert_column("Missing", values, "kelvin")
+
+    def test_load_file(self, tmp_path: Path) -> None:
+        """Test loading a data file using the format metadata."""
+        field_defs = [
+            FieldDefinition(name="Tin", unit="celsius", field_type="temperature"),
+            FieldDefinition(name="Field", unit="tesla", field_type="magnetic_field"),
+        ]
+        metadata = FormatMetadata(delimiter=";", skip_rows=1, comment_char="#")
+        fmt = FormatDefinition("test", metadata=metadata, field_definitions=field_defs)
+        path = tmp_path / "run.txt"
+        path.write_text("M9 run\nTin;Field\n20.0;1.0\n# pause\n25.0;1.5\n", encoding="utf-8")
+
+        data = fmt.load_file(path)
+        assert list(data) == ["Tin", "Field"]
+        np.testing.assert_allclose(data["Tin"], [20.0, 25.0])
+
+        data = fmt.load_file(path, units={"Tin": "kelvin", "Field": "Gauss"})
+        np.testing.assert_allclose(data["Tin"], [293.15, 298.15])
+        np.testing.assert_allclose(data["Field"], [1e4, 1.5e4])
+
+    def test_load_file_without_header(self, tmp_path: Path) -> None:
+        """Test that headerless files use the defined column order."""
+        field_defs = [FieldDefinition(name="t", unit="second"), FieldDefinition(name="I", unit="A")]
+        metadata = FormatMetadata(delimiter=None, header_row=False)
+        fmt = FormatDefinition("test", metadata=metadata, field_definitions=field_defs)
+        path = tmp_path / "run.txt"
+        path.write_text("0.0  100.0\n1.0\t200.0\n", encoding="utf-8")
+
+        data = fmt.load_file(path, units={"I": "kA"})
+        np.testing.assert_allclose(data["t"], [0.0, 1.0])
+        np.testing.assert_allclose(data["I"], [0.1, 0.2])
+
+    def test_load_file_tab_header_with_spaces(self, tmp_path: Path) -> None:
+        """Test that a tab delimiter keeps spaces inside column names."""
+        field_defs = [
+            FieldDefinition(name="Time s", unit="second"),
+            FieldDefinition(name="Field B", unit="tesla"),
+        ]
+        fmt = FormatDefinition("test", field_definitions=field_defs)
+        path = tmp_path / "run.txt"
+        path.write_text("Time s\tField B\n0.0\t1.0\n1.0\t2.0\n", encoding="utf-8")
+
+        data = fmt.load_file(path, units={"Field B": "Gauss"})
+        assert list(data) == ["Time s", "Field B"]
+        np.testing.assert_allclose(data["Field B"], [1e4, 2e4])
+
+    def test_load_file_column_count_mismatch(self, tmp_path: Path) -> None:
+        """Test that a header/data column mismatch raises ValueError."""
+        field_defs = [FieldDefinition(name="t", unit="second"), FieldDefinition(name="I", unit="A")]
+        fmt = FormatDefinition("test", field_definitions=field_defs)
+        path = tmp_path / "run.txt"
+        path.write_text("t\tI\n0.0\t100.0\t5.0\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="3 data columns"):
+            fmt.load_file(path)
+
+        headerless = FormatDefinition(
+            "test", metadata=FormatMetadata(header_row=False), field_definitions=field_defs
+        )
+        path.write_text("0.0\n1.0\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="field definitions"):
+            headerless.load_file(path)
+
     def test_registry_property(self) -> None:
         """Test accessing the internal registry."""
         field_defs = [
@@ -282,6 +441,27 @@ class TestFormatDefinition:
         assert len(result["fields"]) == 1
         assert result["fields"][0]["name"] == "Col1"
 
+    def test_to_dict_reads_live_name_and_metadata(self) -> None:
+        """Test that name and metadata changes show up in later to_dict() calls."""
+        fmt = FormatDefinition("test", field_definitions=[FieldDefinition(name="Col1")])
+        first = fmt.to_dict()
+        fmt.format_name = "renamed"
+        fmt.metadata.delimiter = ","
+        second = fmt.to_dict()
+        assert second["fields"] == first["fields"]
+        assert second["format_name"] == "renamed"
+        assert second["metadata"]["delimiter"] == ","
+        assert FormatDefinition.from_dict(second).column_names == ["Col1"]
+
+    def test_to_dict_results_are_independent(self) -> None:
+        """Test that mutating one to_dict() result does not affect the next."""
+        fmt = FormatDefinition("test", field_definitions=[FieldDefinition(name="Col1")])
+        first = fmt.to_dict()
+        first["fields"][0]["name"] = "changed"
+        first["fields"].append({"name": "extra"})
+        second = fmt.to_dict()
+        assert [entry["name"] for entry in second["fields"]] == ["Col1"]
+
 
 class TestFormatDefinitionFromJSON:
     """Test loading FormatDefinition from JSON files."""
@@ -347,6 +527,17 @@ class TestFormatDefinitionFromJSON:
         finally:
             Path(temp_path).unlink()
 
+    def test_from_json_non_ascii_and_nan(self, tmp_path: Path) -> None:
+        """Test loading UTF-8 symbols and NaN literals (accepted by the json module)."""
+        path = tmp_path / "utf8.json"
+        path.write_text(
+            '{"format_name": "utf8", "fields": [{"name": "rho", "unit": "kg/m^3", '
+            '"symbol": "\u03c1", "description": NaN}]}',
+            encoding="utf-8",
+        )
+        fmt = FormatDefinition.from_json(path)
+        assert fmt.get_field("rho").symbol == "ρ"
+
     def test_from_json_with_path_object(self) -> None:
         """Test loading from JSON using Path object."""
         data = {
@@ -0,0 +1,41 @@
+"""
+Tests for the bulk conversion kernels.
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+
+from python_magnetunits import _kernels
+
+
+class TestKernels:
+    """Test scale and affine conversion kernels."""
+
+    def test_apply_scale_small_array(self) -> None:
+        """Test scaling a small array."""
+        result = _kernels.apply_scale([1.0, 2.0], 1000.0)
+        np.testing.assert_allclose(result, [1000.0, 2000.0])
+
+    def test_apply_scale_large_array(self) -> None:
+        """Test scaling an array above the JIT threshold."""
+        values = np.arange(_kernels.NJIT_THRESHOLD * 2, dtype=float)
+        np.testing.assert_allclose(_kernels.apply_scale(values, 2.0), values * 2.0)
+
+    def test_apply_affine_preserves_shape(self) -> None:
+        """Test affine conversion on a 2-D array above the JIT threshold."""
+        values = np.ones((_kernels.NJIT_THRESHOLD, 2))
+        result = _kernels.apply_affine(values, 1.0, -273.15)
+        assert result.shape == values.shape
+        np.testing.assert_allclose(result, values - 273.15)
+
+    def test_numba_not_imported_at_package_import(self) -> None:
+        """Test that Numba is only imported once a large array is converted."""
+        code = (
+            "import sys, numpy as np; from python_magnetunits import _kernels; "
+            "assert 'numba' not in sys.modules; "
+            "_kernels.apply_scale(np.ones(_kernels.NJIT_THRESHOLD), 2.0); "
+            "assert ('numba' in sys.modules) == _kernels.HAS_NUMBA"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,42 @@
+"""
+Tests for the standard physics field definitions.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from python_magnetunits import physics
+
+
+class TestPhysicsPackage:
+    """Test the physics subpackage."""
+
+    def test_submodules_load_on_first_access(self) -> None:
+        """Test that importing the package does not import the physics submodules."""
+        code = (
+            "import sys, python_magnetunits; "
+            "assert 'python_magnetunits.physics.mechanical' not in sys.modules; "
+            "from python_magnetunits.physics import thermal; "
+            "assert 'python_magnetunits.physics.mechanical' not in sys.modules; "
+            "assert python_magnetunits.physics.thermal is thermal"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_attribute_access(self) -> None:
+        """Test that every listed submodule is reachable as an attribute."""
+        for name in physics.__all__:
+            assert getattr(physics, name).__name__ == f"python_magnetunits.physics.{name}"
+        assert set(physics.__all__) <= set(dir(physics))
+        with pytest.raises(AttributeError):
+            physics.optics  # noqa: B018
+
+    def test_submodule_all_lists_public_fields(self) -> None:
+        """Test that each submodule's __all__ names its fields and register function."""
+        for name in physics.__all__:
+            module = getattr(physics, name)
+            exported = set(module.__all__)
+            assert all(hasattr(module, item) for item in exported)
+            assert {"Field", "ureg", "TYPE_CHECKING"}.isdisjoint(exported)
+            assert any(item.startswith("register_") for item in exported)
@@ -2,7 +2,12 @@
 Tests for the FieldRegistry class.
 """
 
+from typing import Any
+
+import pytest
 from python_magnetunits import Field, FieldRegistry
+from python_magnetunits import field as field_module
+from python_magnetunits.physics import electromagnetic, hydraulics, mechanical, thermal
 
 
 class TestFieldRegistryCreation:
@@ -61,6 +66,65 @@ class TestFieldRegistryRegistration:
         registry.bulk_register(fields)
         assert len(registry) == 3
 
+    def test_bulk_register_matches_sequential_register(self) -> None:
+        """Test that bulk registration resolves lookups like repeated register()."""
+
+        def make_fields() -> list:
+            return [
+                Field(name="B", symbol="X", unit="tesla", aliases=["shared", "flux"]),
+                Field(name="E", symbol="X", unit="volt/meter", aliases=["shared"]),
+                Field(name="flux", symbol="Phi", unit="weber"),
+            ]
+
+        bulk = FieldRegistry()
+        bulk.bulk_register(make_fields())
+        sequential = FieldRegistry()
+        for field in make_fields():
+            sequential.register(field)
+
+        for identifier in ["B", "E", "X", "shared", "flux", "Phi"]:
+            assert bulk.get(identifier) == sequential.get(identifier)
+        assert bulk.get("X").name == "E"
+        assert bulk.get("shared") is None
+        assert bulk.get("flux").name == "flux"
+
+    def test_bulk_register_replaces_existing(self) -> None:
+        """Test that bulk registration replaces fields with existing names."""
+        registry = FieldRegistry()
+        registry.register(Field(name="B", symbol="B", unit="tesla", aliases=["old"]))
+        registry.bulk_register([Field(name="B", symbol="B", unit="millitesla")])
+        assert len(registry) == 1
+        assert "old" not in registry
+        assert str(registry.get("B").unit) == "millitesla"
+
+    def test_bulk_register_same_fields_again(self) -> None:
+        """Test that re-registering the same field objects leaves the registry unchanged."""
+        fields = [
+            Field(name="B", symbol="X", unit="tesla", aliases=["flux"]),
+            Field(name="T", symbol="T", unit="kelvin"),
+        ]
+        registry = FieldRegistry()
+        registry.bulk_register(fields)
+        summary = registry.summary()
+        registry.bulk_register(fields)
+        assert registry.summary() is summary
+        assert registry.get("flux") is fields[0]
+
+        # A field that lost its symbol to a later registration takes it back
+        registry.register(Field(name="E", symbol="X", unit="volt/meter"))
+        registry.bulk_register(fields)
+        assert registry.get("X") is fields[0]
+
+    def test_bulk_register_same_fields_after_category_change(self) -> None:
+        """Test that re-registering picks up a changed metadata category."""
+        field = Field(name="B", symbol="B", unit="tesla", metadata={"category": "em"})
+        registry = FieldRegistry()
+        registry.bulk_register([field])
+        field.metadata["category"] = "thermal"
+        registry.bulk_register([field])
+        assert registry.list_fields(category="em") == []
+        assert registry.list_fields(category="thermal") == [field]
+
 
 class TestFieldRegistryLookup:
     """Test field lookup by various methods."""
@@ -117,6 +181,40 @@ class TestFieldRegistryLookup:
         # Alias "F" matches both fields - should return None
         assert registry.get("F") is None
 
+    def test_lookup_alias_unambiguous_after_removal(self) -> None:
+        """Test that removing one of two fields sharing an alias resolves it."""
+        registry = FieldRegistry()
+        field1 = Field(name="Field1", symbol="F1", unit="tesla", aliases=["F"])
+        field2 = Field(name="Field2", symbol="F2", unit="gauss", aliases=["F"])
+        registry.bulk_register([field1, field2])
+        registry.remove("Field2")
+        assert registry.get("F") is field1
+        assert "F" in registry
+
+    def test_replaced_field_aliases_are_dropped(self) -> None:
+        """Test that replacing a field by name drops the old field's aliases."""
+        registry = FieldRegistry()
+        registry.register(Field(name="B", symbol="B", unit="tesla", aliases=["old"]))
+        new = Field(name="B", symbol="B", unit="tesla", aliases=["new"])
+        registry.register(new)
+        assert registry.get("old") is None
+        assert registry.get("new") is new
+
+    def test_lookup_standard_fields_by_alias(self) -> None:
+        """Test alias lookups across all standard physics fields."""
+        registry = FieldRegistry()
+        electromagnetic.register_electromagnetic_fields(registry)
+        thermal.register_thermal_fields(registry)
+        hydraulics.register_hydraulic_fields(registry)
+        mechanical.register_mechanical_fields(registry)
+
+        assert registry.get("Bx") is electromagnetic.MAGNETIC_FIELD_X
+        assert registry.get("magnetic_flux_density") is electromagnetic.MAGNETIC_FIELD
+        assert registry.get("E_field") is electromagnetic.ELECTRIC_FIELD
+        assert registry.get("velocity_z") is hydraulics.VELOCITY_Z
+        assert registry.get("heat_flux_y") is thermal.HEAT_FLUX_Y
+        assert registry.get("u_x") is mechanical.DISPLACEMENT_X
+
 
 class TestFieldRegistryListing:
     """Test listing fields."""
@@ -158,6 +256,78 @@ class TestFieldRegistryListing:
         assert len(thermal_fields) == 1
         assert thermal_fields[0] is T
 
+    def test_list_fields_with_predicate(self) -> None:
+        """Test filtering fields with a predicate, alone or with a category."""
+        registry = FieldRegistry()
+        B = Field(name="B", symbol="B", unit="tesla", metadata={"category": "electromagnetic"})
+        E = Field(
+            name="E",
+            symbol="E",
+            unit="volt/meter",
+            exclude_regions=["Air"],
+            metadata={"category": "electromagnetic"},
+        )
+        T = Field(name="T", symbol="T", unit="kelvin", exclude_regions=["Air"])
+        registry.bulk_register([B, E, T])
+
+        def excludes_air(field: Field) -> bool:
+            return not field.applies_to_region("Air")
+
+        assert registry.list_fields(predicate=excludes_air) == [E, T]
+        assert registry.list_fields(category="electromagnetic", predicate=excludes_air) == [E]
+
+    def test_list_fields_by_excluded_region(self) -> None:
+        """Test the excluded-region index, alone and combined with a category."""
+        registry = FieldRegistry()
+        B = Field(name="B", symbol="B", unit="tesla", metadata={"category": "electromagnetic"})
+        E = Field(
+            name="E",
+            symbol="E",
+            unit="volt/meter",
+            exclude_regions=["Air", "Isolant"],
+            metadata={"category": "electromagnetic"},
+        )
+        T = Field(name="T", symbol="T", unit="kelvin", exclude_regions=["Air"])
+        registry.bulk_register([B, E, T])
+
+        assert registry.list_fields(excludes_region="Air") == [E, T]
+        assert registry.list_fields(excludes_region="Isolant") == [E]
+        assert registry.list_fields(excludes_region="Vacuum") == []
+        assert registry.list_fields(category="electromagnetic", excludes_region="Air") == [E]
+
+        registry.remove("E")
+        assert registry.list_fields(excludes_region="Air") == [T]
+        assert registry.list_fields(excludes_region="Isolant") == []
+
+    def test_iter_fields_is_lazy(self) -> None:
+        """Test that iter_fields stops at the first match."""
+        registry = FieldRegistry()
+        registry.bulk_register(
+            [Field(name=f"F{i}", symbol=f"F{i}", unit="meter") for i in range(5)]
+        )
+        seen = []
+
+        def is_f1(field: Field) -> bool:
+            seen.append(field.name)
+            return field.name == "F1"
+
+        assert next(registry.iter_fields(predicate=is_f1)).name == "F1"
+        assert seen == ["F0", "F1"]
+
+    def test_list_fields_by_category_after_remove_and_replace(self) -> None:
+        """Test that the category index follows removals and replacements."""
+        registry = FieldRegistry()
+        B = Field(name="B", symbol="B", unit="tesla", metadata={"category": "electromagnetic"})
+        registry.register(B)
+        B_thermal = Field(name="B", symbol="B", unit="tesla", metadata={"category": "thermal"})
+        registry.register(B_thermal)
+
+        assert registry.list_fields(category="electromagnetic") == []
+        assert registry.list_fields(category="thermal") == [B_thermal]
+
+        registry.remove("B")
+        assert registry.list_fields(category="thermal") == []
+
 
 class TestFieldRegistryContainment:
     """Test 'in' operator and has_field method."""
@@ -183,6 +353,24 @@ class TestFieldRegistryContainment:
 class TestFieldRegistryRemoval:
     """Test field removal from registry."""
 
+    def test_remove_after_category_change(self) -> None:
+        """Test that removal uses the category a field was indexed under."""
+        registry = FieldRegistry()
+        field = Field(name="A", symbol="A", unit="tesla", metadata={"category": "em"})
+        registry.register(field)
+        field.metadata["category"] = "thermal"
+        registry.register(field)
+        assert registry.list_fields(category="em") == []
+        assert registry.list_fields(category="thermal") == [field]
+
+        assert registry.remove("A") is True
+        assert registry.list_fields(category="em") == []
+        assert registry.list_fields(category="thermal") == []
+        summary = registry.summary()
+        assert "Total fields: 0" in summary
+        assert "em: " not in summary
+        assert "thermal: " not in summary
+
     def test_remove_existing_field(self) -> None:
         """Test removing an existing field."""
         registry = FieldRegistry()
@@ -228,9 +416,50 @@ class TestFieldRegistryRemoval:
         assert registry.get("flux_density") is None
 
 
+class TestFieldRegistryWarmConversions:
+    """Test precomputing conversions for registered fields."""
+
+    def test_warm_conversions_fills_compatible_pairs(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only dimensionally compatible units are cached."""
+        registry = FieldRegistry()
+        B = Field(name="B", symbol="B", unit="tesla")
+        T = Field(name="T", symbol="T", unit="kelvin")
+        registry.bulk_register([B, T])
+
+        assert registry.warm_conversions(["millitesla", "degC", "bar"]) == 2
+
+        # Warmed conversions no longer compute coefficients through pint
+        def fail(*args: Any) -> None:
+            raise AssertionError("conversion was not warmed")
+
+        monkeypatch.setattr(field_module, "_affine_coefficients", fail)
+        assert B.convert(1.5, "millitesla") == pytest.approx(1500.0)
+        assert T.convert(300.0, "degC") == pytest.approx(26.85)
+
+
 class TestFieldRegistryRepr:
     """Test registry string representation."""
 
+    def test_summary(self) -> None:
+        """Test the summary text and that it follows registry changes."""
+        registry = FieldRegistry()
+        registry.bulk_register(
+            [
+                Field(name="B", symbol="B", unit="tesla", metadata={"category": "electromagnetic"}),
+                Field(name="T", symbol="T", unit="kelvin", metadata={"category": "thermal"}),
+            ]
+        )
+        summary = registry.summary()
+        assert "Total fields: 2" in summary
+        assert "thermal: 1" in summary
+        assert registry.summary() is summary
+
+        registry.remove("T")
+        assert "Total fields: 1" in registry.summary()
+        assert "thermal" not in registry.summary()
+
     def test_repr(self) -> None:
         """Test repr of registry."""
         registry = FieldRegistry()